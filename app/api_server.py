@@ -1,7 +1,7 @@
 import asyncio
 import json
 import os
-from typing import Set
+from typing import Optional, Set
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
@@ -11,6 +11,9 @@ from app.core.config import settings
 
 # Import core components from the main server
 from app.core.container import global_container
+from app.tools.trading import execute_live_order, execute_paper_order
+from common.cache import TTLCache
+from common.errors import AppError
 from marketdata.store import TickerSnapshot
 from observability import build_log_context, log_event
 
@@ -30,24 +33,34 @@ app.add_middleware(
 # Active WebSocket connections
 active_connections: Set[WebSocket] = set()
 
+# The server's event loop, captured at startup so background market-data
+# threads can hand coroutines to it safely.
+_server_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+@app.on_event("startup")
+async def _capture_event_loop():
+    global _server_loop
+    _server_loop = asyncio.get_running_loop()
+
+
 def broadcast_tick(snap: TickerSnapshot):
     """
     Callback for marketdata_ws_store updates.
+
+    Runs on the market-data feed thread, not the server loop; the broadcast
+    coroutine is scheduled onto the captured loop thread-safely.
     """
-    if not active_connections:
+    loop = _server_loop
+    if not active_connections or loop is None or loop.is_closed():
         return
-        
+
+    # Build the payload only once we know it can actually be delivered
     payload = {
         "type": "TICKER_UPDATE",
         "data": snap.to_dict()
     }
-    
-    # We need to run this in the event loop of the FastAPI app
-    # Since this callback might be triggered from a background thread
-    # We use a global loop reference or call_soon_threadsafe
-    loop = asyncio.get_event_loop()
-    if loop.is_running():
-        loop.create_task(broadcast_all(payload))
+    asyncio.run_coroutine_threadsafe(broadcast_all(payload), loop)
 
 async def broadcast_all(payload: dict):
     if not active_connections:
@@ -88,13 +101,56 @@ async def get_pending_approvals():
     """
     Return list of trades awaiting manual approval.
     """
-    return global_container.execution_store.list_pending()
+    # SQLite-backed; run off the event loop so other requests stay responsive.
+    return await asyncio.to_thread(global_container.execution_store.list_pending)
 
 class ApprovalRequest(BaseModel):
     request_id: str
     confirm_token: str
     approve: bool
 
+
+def _execute_stock_order_proposal(proposal) -> dict:
+    # Destructure the payload once instead of re-indexing per field
+    p = proposal.payload
+    symbol = p["symbol"]
+    side = p["side"]
+    amount = p["amount"]
+    price = p.get("price", 0.0)
+
+    if settings.PAPER_MODE:
+        res = execute_paper_order(
+            symbol=symbol,
+            side=side,
+            amount=amount,
+            price=price,
+            rationale=p.get("rationale", "api_approved")
+        )
+        return {"ok": True, "result": res}
+
+    # Live Brokerage Execution (shared with the MCP tool path)
+    try:
+        res = execute_live_order(
+            symbol=symbol,
+            side=side,
+            amount=amount,
+            order_type=p.get("order_type", "market"),
+            price=price if price and price > 0 else None,
+            exchange=p.get("exchange", "alpaca"),
+        )
+        return {"ok": True, "result": res["result"]}
+    except AppError as e:
+        raise HTTPException(status_code=400, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Execution error: {str(e)}")
+
+
+# O(1) dispatch by proposal kind; new kinds register here instead of growing
+# an if/elif chain in the endpoint.
+_PROPOSAL_EXECUTORS = {
+    "stock_order": _execute_stock_order_proposal,
+}
+
 @app.post("/api/approve-trade")
 async def approve_trade(req: ApprovalRequest):
     """
@@ -104,64 +160,49 @@ async def approve_trade(req: ApprovalRequest):
         if req.approve:
             # 1. Confirm the proposal in the store (validates token and expiration)
             try:
-                proposal = global_container.execution_store.confirm(req.request_id, req.confirm_token)
+                proposal = await asyncio.to_thread(
+                    global_container.execution_store.confirm, req.request_id, req.confirm_token
+                )
             except ValueError as ve:
                 raise HTTPException(status_code=400, detail=str(ve))
-            
-            # 2. Execute based on kind
-            if proposal.kind == "stock_order":
-                p = proposal.payload
-                
-                if settings.PAPER_MODE:
-                    res = global_container.paper_engine.execute_trade(
-                        user_id="agent_zero",
-                        side=p["side"],
-                        symbol=p["symbol"],
-                        amount=p["amount"],
-                        price=p.get("price", 0.0),
-                        rationale=p.get("rationale", "api_approved")
-                    )
-                    return {"ok": True, "result": res}
-                else:
-                    # Live Brokerage Execution
-                    exchange = p.get("exchange", "alpaca").lower()
-                    if exchange not in global_container.brokerages:
-                        raise HTTPException(status_code=400, detail=f"Brokerage {exchange} is not supported.")
-                    
-                    brokerage = global_container.brokerages[exchange]
-                    if not brokerage.is_available():
-                        raise HTTPException(status_code=400, detail=f"Brokerage {exchange} is not configured with API keys.")
-                    
-                    try:
-                        res = brokerage.place_order(
-                            symbol=p["symbol"],
-                            side=p["side"],
-                            qty=p["amount"],
-                            order_type=p.get("order_type", "market"),
-                            price=p.get("price") if p.get("price", 0) > 0 else None
-                        )
-                        return {"ok": True, "result": res}
-                    except Exception as e:
-                        raise HTTPException(status_code=500, detail=f"Execution error: {str(e)}")
-            
-            return {"ok": False, "error": "Unknown proposal kind"}
+
+            # 2. Execute based on kind (blocking brokerage/DB work -> worker thread)
+            executor = _PROPOSAL_EXECUTORS.get(proposal.kind)
+            if executor is None:
+                return {"ok": False, "error": "Unknown proposal kind"}
+            return await asyncio.to_thread(executor, proposal)
         else:
-            success = global_container.execution_store.cancel(req.request_id)
+            success = await asyncio.to_thread(global_container.execution_store.cancel, req.request_id)
             return {"ok": success}
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Dashboards poll /api/portfolio every few seconds; a short TTL collapses
+# that duplicate-poll traffic to one pair of DB reads per window.
+_PORTFOLIO_CACHE: TTLCache[str, dict] = TTLCache(max_items=64)
+_PORTFOLIO_TTL_S = 2.0
+
+
 @app.get("/api/portfolio")
 async def get_portfolio():
     """
     Get current portfolio state (paper or live).
     """
     if settings.PAPER_MODE:
-        balances = global_container.paper_engine.get_balances("agent_zero")
-        pnl = global_container.paper_engine.get_risk_metrics("agent_zero")
-        return {"balances": balances, "metrics": pnl}
+        cached = _PORTFOLIO_CACHE.get("agent_zero")
+        if cached is not None:
+            return cached
+        # Independent reads: issue both concurrently instead of serializing
+        # two round trips through the worker thread pool.
+        balances, pnl = await asyncio.gather(
+            asyncio.to_thread(global_container.paper_engine.get_balances, "agent_zero"),
+            asyncio.to_thread(global_container.paper_engine.get_risk_metrics, "agent_zero"),
+        )
+        out = {"balances": balances, "metrics": pnl}
+        _PORTFOLIO_CACHE.set("agent_zero", out, ttl_seconds=_PORTFOLIO_TTL_S)
+        return out
     else:
         # For live mode, we'd need to query the wallet/CEX
         return {"error": "Live portfolio view not yet implemented in API"}
@@ -19,23 +19,22 @@ class ComplianceLedger:
         """
         Write a compliance-stamped event to the audit log.
         """
-        entry = {
-            "timestamp": time.time(),
-            "event_type": event_type,
-            "data": data,
-            "system_integrity_hash": self._sign_entry(data)
-        }
-        
-        log_line = json.dumps(entry)
+        # Serialize the payload once: the same canonical string feeds both the
+        # integrity hash and the log line (previously data was encoded twice).
+        canonical = json.dumps(data, sort_keys=True)
+        log_line = (
+            f'{{"timestamp": {time.time()!r}, "event_type": {json.dumps(event_type)}, '
+            f'"data": {canonical}, "system_integrity_hash": "{self._sign_entry(canonical)}"}}'
+        )
         with open(self.log_path, "a") as f:
             f.write(log_line + "\n")
-            
+
         logger.info(f"[COMPLIANCE] {event_type} recorded.")
 
-    def _sign_entry(self, data: Dict[str, Any]) -> str:
-        # Simple local hash for integrity (non-HSM)
-        payload = json.dumps(data, sort_keys=True)
-        return hashlib.sha256(payload.encode()).hexdigest()
+    def _sign_entry(self, canonical_payload: str) -> str:
+        # Simple local hash for integrity (non-HSM); takes the already
+        # canonicalized (sort_keys) JSON string.
+        return hashlib.sha256(canonical_payload.encode()).hexdigest()
 
     def verify_integrity(self) -> bool:
         """
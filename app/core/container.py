@@ -1,6 +1,9 @@
+import threading
+from typing import Optional
+
 from app.core.config import settings
 from common.idempotency import IdempotencyStore
-from common.rate_limiter import FixedWindowRateLimiter
+from common.rate_limiter import TokenBucketRateLimiter
 from core.backtest import BacktestEngine
 from core.paper import PaperTradingEngine
 from core.policy import PolicyEngine
@@ -38,7 +41,7 @@ class Container:
         self.regime_detector = RegimeDetector()
         self.risk_guardian = RiskGuardian()
         self.policy_engine = PolicyEngine()
-        self.rate_limiter = FixedWindowRateLimiter()
+        self.rate_limiter = TokenBucketRateLimiter()
         
         # Stores
         self.execution_store = ExecutionStore()
@@ -59,24 +62,37 @@ class Container:
             StockMarketDataProvider(exchange_provider=self.exchange_provider),
         ])
         
-        # Brokerages
-        self.alpaca_brokerage = AlpacaBrokerage()
-        self.tradier_brokerage = TradierBrokerage()
-        self.ibkr_brokerage = IBKRBrokerage()
-        self.schwab_brokerage = SchwabBrokerage()
-        self.etrade_brokerage = EtradeBrokerage()
-        self.robinhood_brokerage = RobinhoodBrokerage()
-        
-        # Mapping for easy lookup
-        self.brokerages = {
-            "alpaca": self.alpaca_brokerage,
-            "tradier": self.tradier_brokerage,
-            "ibkr": self.ibkr_brokerage,
-            "schwab": self.schwab_brokerage,
-            "etrade": self.etrade_brokerage,
-            "robinhood": self.robinhood_brokerage
+        # Brokerages are constructed lazily: each client may build an HTTP
+        # session / OAuth state in __init__, and most deployments only ever
+        # use one venue. Instances are cached per venue for the process
+        # lifetime so connection pools are reused across orders.
+        self._brokerage_factories = {
+            "alpaca": AlpacaBrokerage,
+            "tradier": TradierBrokerage,
+            "ibkr": IBKRBrokerage,
+            "schwab": SchwabBrokerage,
+            "etrade": EtradeBrokerage,
+            "robinhood": RobinhoodBrokerage,
         }
-        
+        self._brokerage_cache = {}
+        self._brokerage_lock = threading.Lock()
+
         self.learner = Learner(db_path=self.paper_engine.db_path) if settings.PAPER_MODE and self.paper_engine else None
 
+    def get_brokerage(self, venue: str) -> Optional[object]:
+        """
+        Return the cached brokerage client for a venue (building it on first
+        use), or None for unknown venues.
+        """
+        cached = self._brokerage_cache.get(venue)
+        if cached is not None:
+            return cached
+        factory = self._brokerage_factories.get(venue)
+        if factory is None:
+            return None
+        with self._brokerage_lock:
+            if venue not in self._brokerage_cache:
+                self._brokerage_cache[venue] = factory()
+            return self._brokerage_cache[venue]
+
 global_container = Container()
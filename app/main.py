@@ -1,3 +1,17 @@
+import asyncio
+import functools
+import inspect
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+# The Proactor loop busy-waits when paired with the sync (requests/yfinance)
+# libraries the tools use, burning idle CPU on Windows hosts. Must run before
+# FastMCP (or anything else) creates an event loop.
+if sys.platform == "win32":
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
 from fastmcp import FastMCP
 
 from app.tools.intelligence import register_intelligence_tools
@@ -5,14 +19,84 @@ from app.tools.market import register_market_tools
 from app.tools.research import register_research_tools
 from app.tools.trading import register_trading_tools
 
+# Raw tool callables, indexed by name as they are registered. In-process
+# callers (tests, the API server, scheduled jobs) can dispatch through
+# invoke_direct() and skip the MCP transport entirely.
+_DIRECT_TOOLS: Dict[str, Callable[..., str]] = {}
+
+
+# Execution tools get their own small pool: bursts of orders queue here
+# instead of fanning out across the (cpu_count x 5) default executor and
+# hammering brokerage APIs into rate limits. Read-only tools keep the
+# default pool.
+_EXEC_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("EXEC_POOL_WORKERS", "4")), thread_name_prefix="exec"
+)
+_EXEC_TOOLS = frozenset({
+    "place_market_order",
+    "place_limit_order",
+    "deposit_paper_funds",
+    "reset_paper_wallet",
+})
+
+
+def _offload_to_thread(fn: Callable[..., str]) -> Callable[..., Any]:
+    """
+    Wrap a sync tool so its (often blocking: HTTP, SQLite, yfinance) body runs
+    on a worker thread. A slow tool then no longer stalls the MCP event loop
+    and other concurrent tool calls.
+    """
+    if inspect.iscoroutinefunction(fn):
+        return fn
+
+    if fn.__name__ in _EXEC_TOOLS:
+        @functools.wraps(fn)
+        async def exec_runner(*args: Any, **kwargs: Any) -> str:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_EXEC_POOL, functools.partial(fn, *args, **kwargs))
+
+        return exec_runner
+
+    @functools.wraps(fn)
+    async def runner(*args: Any, **kwargs: Any) -> str:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    return runner
+
+
+class _IndexingMCP:
+    """
+    Thin shim over FastMCP registration: records each raw callable in
+    _DIRECT_TOOLS and then registers it with the real server.
+    """
+
+    def __init__(self, mcp: FastMCP) -> None:
+        self._mcp = mcp
+
+    def add_tool(self, fn: Callable[..., str]) -> None:
+        _DIRECT_TOOLS[fn.__name__] = fn
+        self._mcp.add_tool(_offload_to_thread(fn))
+
+
+def invoke_direct(tool_name: str, **kwargs: Any) -> str:
+    """
+    Call a registered tool in-process, bypassing MCP serialization.
+    """
+    fn = _DIRECT_TOOLS.get(tool_name)
+    if fn is None:
+        raise KeyError(f"Unknown tool: {tool_name}")
+    return fn(**kwargs)
+
+
 # Initialize FastMCP server
 mcp = FastMCP("ReadyTrader-Stocks")
 
-# Register Tools
-register_market_tools(mcp)
-register_trading_tools(mcp)
-register_intelligence_tools(mcp)
-register_research_tools(mcp)
+# Register Tools (through the indexing shim so direct dispatch stays in sync)
+_registry = _IndexingMCP(mcp)
+register_market_tools(_registry)
+register_trading_tools(_registry)
+register_intelligence_tools(_registry)
+register_research_tools(_registry)
 
 if __name__ == "__main__":
     mcp.run()
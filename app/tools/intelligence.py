@@ -1,8 +1,8 @@
-import json
 from typing import Any, Dict
 
 from fastmcp import FastMCP
 
+from common.serialization import dumps_pretty
 from intelligence import get_market_news as _get_mkt_news
 from intelligence import get_market_sentiment as _get_mkt_sentiment
 from intelligence.core import analyze_social_sentiment as _analyze_social
@@ -12,7 +12,7 @@ from intelligence.core import fetch_rss_news as _fetch_rss
 
 def _json_ok(data: Dict[str, Any] | None = None) -> str:
     payload = {"ok": True, "data": data or {}}
-    return json.dumps(payload, indent=2, sort_keys=True)
+    return dumps_pretty(payload)
 
 
 def get_market_sentiment(symbol: str) -> str:
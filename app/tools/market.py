@@ -1,52 +1,72 @@
-import json
+import asyncio
 from typing import Any, Dict, List
 
 from fastmcp import FastMCP
 
 from app.core.container import global_container
+from common.serialization import dumps_pretty, raw_fragment
 
 
 def _json_ok(data: Dict[str, Any] | None = None) -> str:
     payload = {"ok": True, "data": data or {}}
-    return json.dumps(payload, indent=2, sort_keys=True)
+    return dumps_pretty(payload)
 
 
 def _json_err(code: str, message: str, data: Dict[str, Any] | None = None) -> str:
     payload = {"ok": False, "error": {"code": code, "message": message, "data": data or {}}}
-    return json.dumps(payload, indent=2, sort_keys=True)
+    return dumps_pretty(payload)
 
 
 def get_stock_price(symbol: str) -> str:
     """Fetch the latest real-time stock price (bid/ask/last)."""
     try:
-        data = global_container.marketdata_bus.get_ticker(symbol)
+        res = asyncio.run(global_container.marketdata_bus.fetch_ticker(symbol))
+        data = dict(res.data)
+        data["source"] = res.source
         return _json_ok(data)
     except Exception as e:
         return _json_err("market_data_error", str(e), {"symbol": symbol})
 
 
+async def _fetch_price_entry(sym: str) -> Dict[str, Any]:
+    try:
+        res = await global_container.marketdata_bus.fetch_ticker(sym)
+        data = dict(res.data)
+        data["source"] = res.source
+        return data
+    except Exception:
+        return {"error": "could not fetch price"}
+
+
+async def _fetch_price_entries(symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+    # Fan the provider round-trips out concurrently on one loop; one slow
+    # symbol no longer serializes the whole batch.
+    fetched = await asyncio.gather(*(_fetch_price_entry(sym) for sym in symbols))
+    return dict(zip(symbols, fetched))
+
+
 def get_multiple_prices(symbols: List[str]) -> str:
     """Fetch real-time prices for multiple stock tickers simultaneously."""
-    results = {}
-    for sym in symbols:
-        try:
-            results[sym] = global_container.marketdata_bus.get_ticker(sym)
-        except Exception:
-            results[sym] = {"error": "could not fetch price"}
-    return _json_ok({"prices": results})
+    return _json_ok({"prices": asyncio.run(_fetch_price_entries(symbols))})
 
 
 def fetch_ohlcv(symbol: str, timeframe: str = '1d', limit: int = 100) -> str:
     """Fetch historical OHLCV candlestick data for technical analysis."""
     try:
         df = global_container.backtest_engine.fetch_ohlcv(symbol, timeframe, limit)
-        data = df.reset_index().to_dict(orient="records")
-        # Convert timestamps to string
-        for d in data:
-            if 'index' in d:
-                d['timestamp'] = str(d.pop('index'))
-            elif 'Date' in d:
-                d['timestamp'] = str(d.pop('Date'))
+        out = df.reset_index()
+        # Rename the index column once (vectorized) instead of popping it out of every row dict
+        first_col = out.columns[0]
+        if first_col in ('index', 'Date'):
+            out = out.rename(columns={first_col: 'timestamp'})
+            out['timestamp'] = out['timestamp'].astype(str)
+        # Serialize the rows in pandas' C encoder and splice the result into
+        # the envelope; the per-row Python dict materialization only happens
+        # on the stdlib fallback path.
+        frag = raw_fragment(out.to_json(orient="records", date_format="iso"))
+        if frag is not None:
+            return _json_ok({"symbol": symbol, "timeframe": timeframe, "history": frag})
+        data = out.to_dict(orient="records")
         return _json_ok({"symbol": symbol, "timeframe": timeframe, "history": data})
     except Exception as e:
         return _json_err("history_error", str(e), {"symbol": symbol})
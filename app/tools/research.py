@@ -4,17 +4,18 @@ from typing import Any, Dict
 from fastmcp import FastMCP
 
 from app.core.container import global_container
+from common.serialization import dumps_pretty
 from core.stress_test import run_synthetic_stress_test as _run_stress
 
 
 def _json_ok(data: Dict[str, Any] | None = None) -> str:
     payload = {"ok": True, "data": data or {}}
-    return json.dumps(payload, indent=2, sort_keys=True)
+    return dumps_pretty(payload)
 
 
 def _json_err(code: str, message: str, data: Dict[str, Any] | None = None) -> str:
     payload = {"ok": False, "error": {"code": code, "message": message, "data": data or {}}}
-    return json.dumps(payload, indent=2, sort_keys=True)
+    return dumps_pretty(payload)
 
 
 def post_market_insight(symbol: str, agent_id: str, signal: str, confidence: float, reasoning: str, ttl_seconds: int = 3600) -> str:
@@ -1,32 +1,107 @@
-import json
-from typing import Any, Dict
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
 
 from fastmcp import FastMCP
 
 from app.core.compliance import global_compliance_ledger
 from app.core.config import settings
 from app.core.container import global_container
+from common.errors import AppError, classify_exception
+from common.rate_limiter import RateLimitError, resolve_limit
+from common.serialization import dumps_pretty
+from core.policy import PolicyError
 from intelligence import get_cached_sentiment_score
 
 
 def _json_ok(data: Dict[str, Any] | None = None) -> str:
     payload = {"ok": True, "data": data or {}}
-    return json.dumps(payload, indent=2, sort_keys=True)
+    return dumps_pretty(payload)
 
 
 def _json_err(code: str, message: str, data: Dict[str, Any] | None = None) -> str:
     payload = {"ok": False, "error": {"code": code, "message": message, "data": data or {}}}
-    return json.dumps(payload, indent=2, sort_keys=True)
+    return dumps_pretty(payload)
 
 
-def place_market_order(symbol: str, side: str, amount: float, rationale: str = "") -> str:
+# Single worker keeps ledger writes ordered while letting them overlap the
+# sentiment/risk work that runs before execution.
+_COMPLIANCE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="compliance-ledger")
+
+# Live-execution preflight. TRADING_HALTED and LIVE_TRADING_ENABLED are
+# operator kill switches, so they must be re-read at runtime rather than from
+# the import-time Settings snapshot; the parse result is memoized for ~1s so
+# the per-order cost stays a single monotonic-clock comparison.
+_GATE_TTL_S = 1.0
+_gate_cache: Tuple[float, Optional[AppError]] = (0.0, None)
+
+
+def _live_execution_gate() -> Optional[AppError]:
+    global _gate_cache
+    now = time.monotonic()
+    expires_at, cached = _gate_cache
+    if now < expires_at:
+        return cached
+
+    err: Optional[AppError] = None
+    if (os.getenv("TRADING_HALTED", "false").strip().lower() == "true"):
+        err = AppError("trading_halted", "Live trading is halted by the operator kill switch (TRADING_HALTED=true).", {})
+    elif (os.getenv("LIVE_TRADING_ENABLED", "false").strip().lower() != "true"):
+        err = AppError("live_trading_disabled", "Live execution requires LIVE_TRADING_ENABLED=true.", {})
+    _gate_cache = (now + _GATE_TTL_S, err)
+    return err
+
+
+def execute_live_order(
+    *, symbol: str, side: str, amount: float, order_type: str = "market",
+    price: float | None = None, exchange: str = "alpaca"
+) -> Dict[str, Any]:
+    """
+    Route an order to the configured live brokerage.
+    Shared by the MCP tool path and the API approval path.
+    """
+    gate = _live_execution_gate()
+    if gate is not None:
+        raise gate
+    ex = exchange.lower()
+    brokerage = global_container.get_brokerage(ex)
+    if brokerage is None:
+        raise AppError("brokerage_not_supported", f"Brokerage {exchange} not found.", {"exchange": exchange})
+    if not brokerage.is_available():
+        raise AppError("brokerage_not_configured", f"Brokerage {exchange} is not configured with API keys.", {"exchange": exchange})
+    res = brokerage.place_order(symbol=symbol, side=side, qty=amount, order_type=order_type, price=price)
+    return {"venue": ex, "result": res}
+
+
+def execute_paper_order(
+    *, symbol: str, side: str, amount: float, price: float = 0.0, rationale: str = ""
+) -> Dict[str, Any]:
+    """
+    Run a paper-mode order through the shared engine.
+    Shared by the MCP tool path and the API approval path (mirrors
+    execute_live_order) so the two branches can't drift apart.
+    """
+    return global_container.paper_engine.execute_trade(
+        user_id="agent_zero", side=side, symbol=symbol, amount=amount,
+        price=price, rationale=rationale,
+    )
+
+
+def _remember_idempotent(idem_key: str, response: str) -> None:
+    # Only successful submissions are replayable; errors should re-execute.
+    if idem_key:
+        global_container.idempotency_store.set(idem_key, {"response": response})
+
+
+def place_market_order(symbol: str, side: str, amount: float, rationale: str = "", idempotency_key: str = "") -> str:
     """Place a market order for a stock."""
-    return place_stock_order(symbol, side, amount, order_type="market", rationale=rationale)
+    return place_stock_order(symbol, side, amount, order_type="market", rationale=rationale, idempotency_key=idempotency_key)
 
 
-def place_limit_order(symbol: str, side: str, amount: float, price: float, rationale: str = "") -> str:
+def place_limit_order(symbol: str, side: str, amount: float, price: float, rationale: str = "", idempotency_key: str = "") -> str:
     """Place a limit order for a stock."""
-    return place_stock_order(symbol, side, amount, price=price, order_type="limit", rationale=rationale)
+    return place_stock_order(symbol, side, amount, price=price, order_type="limit", rationale=rationale, idempotency_key=idempotency_key)
 
 
 def deposit_paper_funds(asset: str, amount: float) -> str:
@@ -53,7 +128,7 @@ def validate_trade_risk(side: str, symbol: str, amount_usd: float, portfolio_val
         drawdown = 0.0
         
         if settings.PAPER_MODE:
-             metrics = global_container.paper_engine.get_risk_metrics("agent_zero")
+             metrics = global_container.paper_engine.snapshot("agent_zero")["metrics"]
              daily_loss = metrics.get('daily_pnl_pct', 0.0)
              drawdown = metrics.get('drawdown_pct', 0.0)
         
@@ -83,22 +158,50 @@ def place_stock_order(
     amount: float, 
     price: float = 0.0, 
     order_type: str = "market", 
-    exchange: str = "alpaca", 
-    rationale: str = "", 
-    audit_context: str = ""
+    exchange: str = "alpaca",
+    rationale: str = "",
+    audit_context: str = "",
+    idempotency_key: str = ""
 ) -> str:
-    # Compliance Record
-    global_compliance_ledger.record_event("trade_start", {
+    # Idempotent retry fast path: checked before the rate limiter and risk
+    # gates so a duplicate agent retry is an O(1) cache hit instead of a
+    # re-execution (and doesn't burn rate-limit budget).
+    idem_key = (idempotency_key or "").strip()
+    if idem_key:
+        cached = global_container.idempotency_store.get(idem_key)
+        if cached is not None:
+            return cached["response"]
+
+    # Normalize the textual fields once here; the risk, policy and brokerage
+    # layers otherwise each re-strip/lowercase them per order.
+    symbol = symbol.strip().upper()
+    side = side.strip().lower()
+    order_type = order_type.strip().lower()
+    exchange = exchange.strip().lower()
+
+    try:
+        global_container.rate_limiter.check(
+            key="tool:place_stock_order",
+            limit=resolve_limit("place_stock_order"),
+            window_seconds=60,
+        )
+    except RateLimitError as e:
+        return _json_err(e.code, e.message, e.data)
+
+    # Compliance Record: the disk write runs concurrently with the risk check
+    # below; we join before any order is actually executed.
+    record_future = _COMPLIANCE_POOL.submit(global_compliance_ledger.record_event, "trade_start", {
         "symbol": symbol, "side": side, "amount": amount, "rationale": rationale, "audit_context": audit_context
     })
-    
+
     # Risk Guardian Check
     try:
         portfolio_value = 100000.0
         sentiment_score = 0.0
         if settings.PAPER_MODE:
-             metrics = global_container.paper_engine.get_risk_metrics("agent_zero")
-             portfolio_value = metrics.get('equity', 100000.0)
+             # Only the mark-to-market value feeds the risk check here; skip
+             # snapshot()'s full equity-history scan whose metrics we'd discard.
+             portfolio_value = global_container.paper_engine.get_portfolio_value_usd("agent_zero") or 100000.0
         
         est_px = price if price > 0 else 1.0
         risk_result = global_container.risk_guardian.validate_trade(
@@ -116,37 +219,49 @@ def place_stock_order(
                     "order_type": order_type, "rationale": rationale, "exchange": exchange
                 }
             )
-            return _json_ok({
+            out = _json_ok({
                 "status": "pending_approval",
                 "request_id": proposal.request_id,
                 "confirm_token": proposal.confirm_token,
                 "order_details": proposal.payload
             })
+            _remember_idempotent(idem_key, out)
+            return out
             
     except Exception as e:
         return _json_err("risk_validation_error", str(e))
 
-    # Execution
+    # Execution (the compliance entry must be durable before we act on it)
+    record_future.result()
     if settings.PAPER_MODE:
-        res = global_container.paper_engine.execute_trade(
-            user_id="agent_zero", side=side, symbol=symbol, amount=amount,
+        res = execute_paper_order(
+            symbol=symbol, side=side, amount=amount,
             price=price if price > 0 else 0.0, rationale=rationale or "stock_order_paper"
         )
-        return _json_ok({"venue": "paper", "result": res})
+        out = _json_ok({"venue": "paper", "result": res})
+        _remember_idempotent(idem_key, out)
+        return out
     
     try:
         global_container.policy_engine.validate_brokerage_order(
             exchange_id=exchange, symbol=symbol, side=side, amount=amount, market_type="spot"
         )
-        ex = exchange.lower()
-        if ex not in global_container.brokerages:
-            return _json_err("brokerage_not_supported", f"Brokerage {exchange} not found.")
-            
-        brokerage = global_container.brokerages[ex]
-        res = brokerage.place_order(symbol=symbol, side=side, qty=amount, order_type=order_type, price=price if price > 0 else None)
-        return _json_ok({"venue": ex, "result": res})
+        res = execute_live_order(
+            symbol=symbol, side=side, amount=amount, order_type=order_type,
+            price=price if price > 0 else None, exchange=exchange
+        )
+        out = _json_ok(res)
+        _remember_idempotent(idem_key, out)
+        return out
+    except (PolicyError, AppError) as e:
+        # Same structured body for both; one tuple clause keeps the handler
+        # chain short on the error path.
+        return _json_err(e.code, e.message, e.data)
     except Exception as e:
-        return _json_err("execution_error", str(e))
+        # Brokerage/provider failures: classify into a stable code; str(e)
+        # is only rendered here, once the error path is confirmed.
+        err = classify_exception(e)
+        return _json_err(err.code, err.message, err.data)
 
 
 def register_trading_tools(mcp: FastMCP):
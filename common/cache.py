@@ -9,7 +9,9 @@ K = TypeVar("K")
 V = TypeVar("V")
 
 
-@dataclass
+# slots: an entry is allocated on every cache set across all TTL caches
+# (tickers, OHLCV, yfinance handles), so drop the per-instance __dict__.
+@dataclass(slots=True)
 class _Entry(Generic[V]):
     value: V
     expires_at: float
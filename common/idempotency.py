@@ -5,8 +5,18 @@ import os
 import sqlite3
 import threading
 import time
+from collections import OrderedDict
 from typing import Any, Dict, Optional
 
+# Bound on the in-memory hot cache; SQLite (when configured) keeps the full
+# history, so eviction only costs a re-read on an old key.
+_MEM_MAX_ITEMS = 8192
+
+# The hot cache is sharded so concurrent lookups on disjoint keys do not
+# serialize through one global mutex. Each shard is its own small LRU.
+_SHARDS = 16
+_SHARD_MAX_ITEMS = _MEM_MAX_ITEMS // _SHARDS
+
 
 class IdempotencyStore:
     """
@@ -23,23 +33,31 @@ class IdempotencyStore:
     """
 
     def __init__(self) -> None:
-        self._lock = threading.Lock()
-        self._mem: Dict[str, Dict[str, Any]] = {}
+        # shard -> (lock, LRU). Most recently used keys live at the end of
+        # each LRU; oldest evicted first.
+        self._shard_locks = [threading.Lock() for _ in range(_SHARDS)]
+        self._shards: list[OrderedDict[str, Dict[str, Any]]] = [OrderedDict() for _ in range(_SHARDS)]
+        self._conn_lock = threading.Lock()
         self._conn: Optional[sqlite3.Connection] = None
 
     def clear(self) -> None:
         """
         Clear in-memory cache (useful for tests). Does not delete persisted data.
         """
-        with self._lock:
-            self._mem.clear()
+        for lock, shard in zip(self._shard_locks, self._shards):
+            with lock:
+                shard.clear()
 
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         k = (key or "").strip()
         if not k:
             return None
-        with self._lock:
-            cached = self._mem.get(k)
+        idx = hash(k) % _SHARDS
+        with self._shard_locks[idx]:
+            shard = self._shards[idx]
+            cached = shard.get(k)
+            if cached is not None:
+                shard.move_to_end(k)
         if cached is not None:
             return cached
 
@@ -55,8 +73,8 @@ class IdempotencyStore:
                 return None
         except Exception:
             return None
-        with self._lock:
-            self._mem[k] = payload
+        with self._shard_locks[idx]:
+            self._mem_insert(idx, k, payload)
         return payload
 
     def set(self, key: str, payload: Dict[str, Any]) -> None:
@@ -66,8 +84,9 @@ class IdempotencyStore:
         if not isinstance(payload, dict):
             raise TypeError("payload must be a dict")
 
-        with self._lock:
-            self._mem[k] = payload
+        idx = hash(k) % _SHARDS
+        with self._shard_locks[idx]:
+            self._mem_insert(idx, k, payload)
 
         conn = self._get_conn()
         if conn is None:
@@ -83,6 +102,14 @@ class IdempotencyStore:
         )
         conn.commit()
 
+    def _mem_insert(self, shard_idx: int, key: str, payload: Dict[str, Any]) -> None:
+        # Caller must hold the shard's lock.
+        shard = self._shards[shard_idx]
+        shard[key] = payload
+        shard.move_to_end(key)
+        while len(shard) > _SHARD_MAX_ITEMS:
+            shard.popitem(last=False)
+
     def _db_path(self) -> str:
         default = "data/idempotency.db"
         p = (os.getenv("READYTRADER_IDEMPOTENCY_DB_PATH") or os.getenv("IDEMPOTENCY_DB_PATH") or default).strip()
@@ -90,10 +117,12 @@ class IdempotencyStore:
         return p
 
     def _get_conn(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None:
+            return self._conn
         path = self._db_path()
         if not path:
             return None
-        with self._lock:
+        with self._conn_lock:
             if self._conn is None:
                 self._conn = sqlite3.connect(path, check_same_thread=False)
                 self._conn.execute("PRAGMA journal_mode=WAL;")
@@ -109,4 +138,3 @@ class IdempotencyStore:
                 )
                 self._conn.commit()
             return self._conn
-
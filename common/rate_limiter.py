@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import threading
 import time
 from dataclasses import dataclass
@@ -13,29 +14,71 @@ class RateLimitError(Exception):
     data: Dict[str, object]
 
 
+# tool_key -> resolved per-minute limit. Limits are env-driven but stable for
+# the process lifetime, so they are parsed once instead of on every call.
+_LIMIT_CACHE: Dict[str, int] = {}
+
+
+def resolve_limit(tool_key: str) -> int:
+    """
+    Per-tool requests-per-minute limit.
+
+    Env:
+    - RATE_LIMIT_<TOOLKEY>_PER_MIN (e.g. RATE_LIMIT_PLACE_STOCK_ORDER_PER_MIN)
+    - RATE_LIMIT_DEFAULT_PER_MIN (default 120)
+    """
+    cached = _LIMIT_CACHE.get(tool_key)
+    if cached is not None:
+        return cached
+    raw = (os.getenv(f"RATE_LIMIT_{tool_key.upper()}_PER_MIN") or "").strip()
+    if not raw:
+        raw = (os.getenv("RATE_LIMIT_DEFAULT_PER_MIN") or "").strip()
+    try:
+        limit = int(raw) if raw else 120
+    except ValueError:
+        limit = 120
+    _LIMIT_CACHE[tool_key] = limit
+    return limit
+
+
+def reset_rate_limit_cache() -> None:
+    """
+    Drop cached per-tool limits (useful for tests that tweak env).
+    """
+    _LIMIT_CACHE.clear()
+
+
+# Number of lock stripes; concurrent checks on different keys only contend
+# when their keys hash to the same stripe.
+_STRIPES = 64
+
+
 class FixedWindowRateLimiter:
     """
     Simple fixed-window limiter: max N events per window_seconds per key.
-    In-memory only (resets on restart).
+    In-memory only (resets on restart). State is striped across independent
+    locks so checks for unrelated keys do not serialize on one global lock.
     """
 
     def __init__(self) -> None:
-        # key -> (window_start_epoch_sec, count)
-        self._lock = threading.Lock()
-        self._state: Dict[str, Tuple[int, int]] = {}
+        # stripe -> {key -> (window_start_epoch_sec, count)}
+        self._locks = [threading.Lock() for _ in range(_STRIPES)]
+        self._states: list[Dict[str, Tuple[int, int]]] = [{} for _ in range(_STRIPES)]
 
     def check(self, *, key: str, limit: int, window_seconds: int) -> None:
         if limit <= 0:
             return
-        with self._lock:
+        stripe = hash(key) % _STRIPES
+        with self._locks[stripe]:
+            state = self._states[stripe]
             now = int(time.time())
             window_start = now - (now % window_seconds)
-            prev = self._state.get(key)
+            prev = state.get(key)
             if not prev or prev[0] != window_start:
-                self._state[key] = (window_start, 1)
+                state[key] = (window_start, 1)
                 return
             count = prev[1] + 1
-            self._state[key] = (window_start, count)
+            state[key] = (window_start, count)
             if count > limit:
                 raise RateLimitError(
                     code="rate_limited",
@@ -43,3 +86,45 @@ class FixedWindowRateLimiter:
                     data={"key": key, "limit": limit, "window_seconds": window_seconds, "count": count},
                 )
 
+
+class TokenBucketRateLimiter:
+    """
+    Token bucket with lazy refill on a monotonic clock.
+
+    Smoother than the fixed window at boundaries (no 2x bursts when a window
+    rolls over) and O(1) per check: refill is computed from the elapsed time,
+    so there is no sweeper thread. Bucket capacity is `limit` and it refills
+    at limit/window_seconds tokens per second. Same check() signature as
+    FixedWindowRateLimiter so the two are drop-in interchangeable.
+    """
+
+    def __init__(self) -> None:
+        # stripe -> {key -> (tokens, last_refill_monotonic)}
+        self._locks = [threading.Lock() for _ in range(_STRIPES)]
+        self._states: list[Dict[str, Tuple[float, float]]] = [{} for _ in range(_STRIPES)]
+
+    def check(self, *, key: str, limit: int, window_seconds: int) -> None:
+        if limit <= 0:
+            return
+        rate = limit / float(window_seconds)
+        stripe = hash(key) % _STRIPES
+        with self._locks[stripe]:
+            state = self._states[stripe]
+            now = time.monotonic()
+            tokens, last = state.get(key, (float(limit), now))
+            tokens = min(float(limit), tokens + (now - last) * rate)
+            if tokens >= 1.0:
+                state[key] = (tokens - 1.0, now)
+                return
+            state[key] = (tokens, now)
+            raise RateLimitError(
+                code="rate_limited",
+                message="Rate limit exceeded.",
+                data={
+                    "key": key,
+                    "limit": limit,
+                    "window_seconds": window_seconds,
+                    "retry_after_seconds": round((1.0 - tokens) / rate, 3),
+                },
+            )
+
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+import os
+from functools import lru_cache
+from typing import Any, Dict
+
+# orjson is optional: it encodes several times faster than the stdlib, but the
+# stdlib output shape (2-space indent, sorted keys) is kept as the fallback.
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+    # Option bitmasks are combined once here; dumps_pretty runs on every tool
+    # response, so it should not rebuild them per call.
+    _OPT_COMPACT = orjson.OPT_SORT_KEYS
+    _OPT_PRETTY = orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2
+except ImportError:
+    _ORJSON_AVAILABLE = False
+    _OPT_COMPACT = _OPT_PRETTY = 0
+
+
+@lru_cache(maxsize=4)
+def _parse_pretty(raw: str) -> bool:
+    return raw.strip() != "0"
+
+
+def _pretty_enabled() -> bool:
+    # Pretty-printing is the default (human-readable tool output); operators
+    # can set JSON_PRETTY=0 to drop indentation and save encoding CPU. The
+    # parse is memoized on the raw env string (see _parse_csv_set et al.).
+    return _parse_pretty(os.getenv("JSON_PRETTY") or "1")
+
+
+def raw_fragment(raw_json: str) -> Any:
+    """
+    Wrap an already-serialized JSON string so it can be embedded verbatim in a
+    dumps_pretty payload. Returns None when orjson is unavailable (the stdlib
+    encoder cannot splice raw fragments); callers must then fall back to
+    passing plain Python objects.
+    """
+    # orjson.Fragment is missing from older builds; treat those like no orjson.
+    if _ORJSON_AVAILABLE and hasattr(orjson, "Fragment"):
+        return orjson.Fragment(raw_json.encode("utf-8"))
+    return None
+
+
+def dumps_pretty(payload: Dict[str, Any]) -> str:
+    """
+    Encode a tool response envelope (sorted keys; 2-space indent unless
+    JSON_PRETTY=0).
+
+    Uses orjson when installed; falls back to the stdlib for payloads orjson
+    cannot serialize (or when it is not installed).
+    """
+    pretty = _pretty_enabled()
+    if _ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(payload, option=_OPT_PRETTY if pretty else _OPT_COMPACT).decode("utf-8")
+        except TypeError:
+            pass
+    if pretty:
+        return json.dumps(payload, indent=2, sort_keys=True)
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"))
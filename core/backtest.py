@@ -1,5 +1,6 @@
 from typing import Any, Dict
 
+import numpy as np
 import pandas as pd
 import ta
 from RestrictedPython import compile_restricted, safe_globals, utility_builtins
@@ -101,38 +102,44 @@ class BacktestEngine:
             trades = []
             state = {} # Persistent state for the strategy
             
-            for i, row in df.iterrows():
+            # Pull the columns out as contiguous numpy arrays once; iterrows()
+            # would re-box every cell into a Series per candle.
+            closes = df['close'].to_numpy(dtype=float)
+            rsis = df['rsi'].to_numpy(dtype=float)
+            timestamps = df['timestamp'].astype(str).to_numpy()
+
+            for i in range(len(closes)):
                 # Provide simple inputs for Phase 4 proof
-                current_price = row['close']
-                rsi = row['rsi']
-                
+                current_price = float(closes[i])
+                rsi = rsis[i]
+
                 # Handling NaN for first few rows
-                if pd.isna(rsi):
+                if np.isnan(rsi):
                     continue
-                
+
                 # Call Strategy
                 try:
                     # Signature: on_candle(price, rsi, state) -> action
-                    action = on_candle(current_price, rsi, state)
+                    action = on_candle(current_price, float(rsi), state)
                 except Exception as e:
                     return {"error": f"Runtime error in strategy at row {i}: {str(e)}"}
-                
+
                 # Execute Logic (Simple)
                 if action == 'buy' and capital > 0:
                     # Buy All
                     amount = capital / current_price
                     position = amount
                     capital = 0
-                    trades.append({'type': 'buy', 'price': current_price, 'time': str(row['timestamp'])})
-                    
+                    trades.append({'type': 'buy', 'price': current_price, 'time': timestamps[i]})
+
                 elif action == 'sell' and position > 0:
                     # Sell All
                     capital = position * current_price
                     position = 0
-                    trades.append({'type': 'sell', 'price': current_price, 'time': str(row['timestamp'])})
-            
+                    trades.append({'type': 'sell', 'price': current_price, 'time': timestamps[i]})
+
             # Final Value
-            final_value = capital if capital > 0 else position * df.iloc[-1]['close']
+            final_value = capital if capital > 0 else position * float(closes[-1])
             pnl = final_value - initial_capital
             pnl_percent = (pnl / initial_capital) * 100
             
@@ -1,71 +1,115 @@
 import os
 import sqlite3
+import threading
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# Assets valued at $1 without a cached price. Built once at import instead of
+# re-materializing a set literal on every balance/price lookup.
+_USD_STABLE = frozenset({"USD", "USDT", "USDC", "DAI"})
+
+
+def _insufficient(balance: float, needed: float) -> bool:
+    """
+    Float balances accumulate representation error across repeated adds
+    (0.1 + 0.2 style), so a strict `balance < needed` can reject selling a
+    full position over ~1e-16 of dust. Shortfalls within 1e-9 (relative)
+    of the requirement are treated as rounding residue, not insufficiency.
+    """
+    return balance < needed and (needed - balance) > 1e-9 * max(1.0, abs(needed))
+
+
+@lru_cache(maxsize=4096)
+def _split_symbol(symbol: str) -> Tuple[str, str]:
+    """
+    Split a symbol into (base, quote); memoized since the universe of symbols
+    an agent trades in one session is small and the parse repeats per order.
+    """
+    s = symbol.strip().upper()
+    if '/' in s:
+        parts = s.split('/', 1)
+        return parts[0], parts[1]
+    # For stocks, base is the ticker, quote is USD
+    return s, "USD"
 
 
 class PaperTradingEngine:
     def __init__(self, db_path: Optional[str] = None):
         self.db_path = db_path or os.getenv("READYTRADER_PAPER_DB_PATH", os.getenv("PAPER_DB_PATH", "data/paper.db"))
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        # One cached connection shared across calls (same pattern as AuditLog /
+        # IdempotencyStore) instead of a fresh sqlite3.connect per method.
+        # RLock because writers nest (execute_trade -> deposit -> _snapshot_equity).
+        self._db_lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
         self._init_db()
-        
+
+    def _connect(self) -> sqlite3.Connection:
+        # Fast path: connection is established once per engine lifetime.
+        if self._conn is not None:
+            return self._conn
+        with self._db_lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL;")
+            return self._conn
+
     def _init_db(self):
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        # Create balances table
-        c.execute('''CREATE TABLE IF NOT EXISTS balances
-                     (user_id TEXT, asset TEXT, amount REAL, 
-                      PRIMARY KEY (user_id, asset))''')
-        # Create orders table
-        # NOTE: Prior versions had a schema bug (duplicate column names). We create a correct schema here.
-        c.execute(
-            '''CREATE TABLE IF NOT EXISTS orders
-                     (id INTEGER PRIMARY KEY AUTOINCREMENT,
-                      user_id TEXT NOT NULL,
-                      timestamp TEXT DEFAULT CURRENT_TIMESTAMP,
-                      side TEXT NOT NULL,
-                      symbol TEXT NOT NULL,
-                      amount REAL NOT NULL,
-                      price REAL NOT NULL,
-                      total_value REAL NOT NULL,
-                      type TEXT DEFAULT 'market',
-                      status TEXT DEFAULT 'filled',
-                      rationale TEXT,
-                      pnl_realized REAL)'''
-        )
+        with self._db_lock:
+            conn = self._connect()
+            c = conn.cursor()
+            # Create balances table
+            c.execute('''CREATE TABLE IF NOT EXISTS balances
+                         (user_id TEXT, asset TEXT, amount REAL,
+                          PRIMARY KEY (user_id, asset))''')
+            # Create orders table
+            # NOTE: Prior versions had a schema bug (duplicate column names). We create a correct schema here.
+            c.execute(
+                '''CREATE TABLE IF NOT EXISTS orders
+                         (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                          user_id TEXT NOT NULL,
+                          timestamp TEXT DEFAULT CURRENT_TIMESTAMP,
+                          side TEXT NOT NULL,
+                          symbol TEXT NOT NULL,
+                          amount REAL NOT NULL,
+                          price REAL NOT NULL,
+                          total_value REAL NOT NULL,
+                          type TEXT DEFAULT 'market',
+                          status TEXT DEFAULT 'filled',
+                          rationale TEXT,
+                          pnl_realized REAL)'''
+            )
 
-        # Equity snapshots for real drawdown/daily PnL metrics
-        c.execute(
-            '''CREATE TABLE IF NOT EXISTS equity_snapshots
-                     (id INTEGER PRIMARY KEY AUTOINCREMENT,
-                      user_id TEXT NOT NULL,
-                      timestamp TEXT DEFAULT CURRENT_TIMESTAMP,
-                      equity_usd REAL NOT NULL)'''
-        )
+            # Equity snapshots for real drawdown/daily PnL metrics
+            c.execute(
+                '''CREATE TABLE IF NOT EXISTS equity_snapshots
+                         (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                          user_id TEXT NOT NULL,
+                          timestamp TEXT DEFAULT CURRENT_TIMESTAMP,
+                          equity_usd REAL NOT NULL)'''
+            )
 
-        # Asset price cache (derived from executed trades; no external price feed required)
-        c.execute(
-            '''CREATE TABLE IF NOT EXISTS asset_prices
-                     (asset TEXT PRIMARY KEY,
-                      price_usd REAL NOT NULL,
-                      updated_at TEXT DEFAULT CURRENT_TIMESTAMP)'''
-        )
-        conn.commit()
-        
-        # Schema Migration: ensure required columns exist for older DBs
-        cols = {row[1] for row in c.execute("PRAGMA table_info(orders)").fetchall()}
-        if "rationale" not in cols:
-            c.execute("ALTER TABLE orders ADD COLUMN rationale TEXT")
-        if "pnl_realized" not in cols:
-            c.execute("ALTER TABLE orders ADD COLUMN pnl_realized REAL")
-        if "type" not in cols:
-            c.execute("ALTER TABLE orders ADD COLUMN type TEXT DEFAULT 'market'")
-        if "status" not in cols:
-            c.execute("ALTER TABLE orders ADD COLUMN status TEXT DEFAULT 'filled'")
-        conn.commit()
-            
-        conn.close()
+            # Asset price cache (derived from executed trades; no external price feed required)
+            c.execute(
+                '''CREATE TABLE IF NOT EXISTS asset_prices
+                         (asset TEXT PRIMARY KEY,
+                          price_usd REAL NOT NULL,
+                          updated_at TEXT DEFAULT CURRENT_TIMESTAMP)'''
+            )
+            conn.commit()
+
+            # Schema Migration: ensure required columns exist for older DBs
+            cols = {row[1] for row in c.execute("PRAGMA table_info(orders)").fetchall()}
+            if "rationale" not in cols:
+                c.execute("ALTER TABLE orders ADD COLUMN rationale TEXT")
+            if "pnl_realized" not in cols:
+                c.execute("ALTER TABLE orders ADD COLUMN pnl_realized REAL")
+            if "type" not in cols:
+                c.execute("ALTER TABLE orders ADD COLUMN type TEXT DEFAULT 'market'")
+            if "status" not in cols:
+                c.execute("ALTER TABLE orders ADD COLUMN status TEXT DEFAULT 'filled'")
+            conn.commit()
 
     def _now_iso(self) -> str:
         return datetime.now(timezone.utc).isoformat()
@@ -73,25 +117,22 @@ class PaperTradingEngine:
     def _set_asset_price_usd(self, asset: str, price_usd: float) -> None:
         if price_usd <= 0:
             return
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute(
-            "INSERT OR REPLACE INTO asset_prices (asset, price_usd, updated_at) VALUES (?, ?, ?)",
-            (asset.upper(), float(price_usd), self._now_iso()),
-        )
-        conn.commit()
-        conn.close()
+        with self._db_lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO asset_prices (asset, price_usd, updated_at) VALUES (?, ?, ?)",
+                (asset.upper(), float(price_usd), self._now_iso()),
+            )
+            conn.commit()
 
     def _get_asset_price_usd(self, asset: str) -> Optional[float]:
         a = asset.upper()
-        if a in {"USD", "USDT", "USDC", "DAI"}:
+        if a in _USD_STABLE:
             return 1.0
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("SELECT price_usd FROM asset_prices WHERE asset=?", (a,))
-        row = c.fetchone()
-        conn.close()
-        return float(row[0]) if row else None
+        with self._db_lock:
+            row = self._connect().execute("SELECT price_usd FROM asset_prices WHERE asset=?", (a,)).fetchone()
+        # price_usd is a REAL column; sqlite3 already hands back a float.
+        return row[0] if row else None
 
     def get_portfolio_value_usd(self, user_id: str) -> float:
         """
@@ -99,63 +140,85 @@ class PaperTradingEngine:
         Stablecoins are valued at $1.
         Assets without a known price are excluded (conservative).
         """
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("SELECT asset, amount FROM balances WHERE user_id=?", (user_id,))
-        rows = c.fetchall()
-        conn.close()
+        # Single join instead of one asset_prices lookup per held asset.
+        with self._db_lock:
+            rows = self._connect().execute(
+                """
+                SELECT b.asset, b.amount, p.price_usd
+                FROM balances b LEFT JOIN asset_prices p ON p.asset = b.asset
+                WHERE b.user_id=?
+                """,
+                (user_id,),
+            ).fetchall()
 
+        # amount/price_usd are REAL columns, so the rows already carry floats;
+        # coercion happens once on the write side, not per read.
         total = 0.0
-        for asset, amount in rows:
+        for asset, amount, px in rows:
             if amount is None:
                 continue
-            px = self._get_asset_price_usd(asset)
+            if px is None:
+                px = 1.0 if str(asset).upper() in _USD_STABLE else None
             if px is None:
                 continue
-            total += float(amount) * float(px)
-        return float(total)
+            total += amount * px
+        return total
 
     def _snapshot_equity(self, user_id: str) -> None:
         equity = self.get_portfolio_value_usd(user_id)
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute(
-            "INSERT INTO equity_snapshots (user_id, timestamp, equity_usd) VALUES (?, ?, ?)",
-            (user_id, self._now_iso(), float(equity)),
-        )
-        conn.commit()
-        conn.close()
-        
+        with self._db_lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT INTO equity_snapshots (user_id, timestamp, equity_usd) VALUES (?, ?, ?)",
+                (user_id, self._now_iso(), equity),
+            )
+            conn.commit()
+
+    def get_balances(self, user_id: str) -> Dict[str, float]:
+        """All asset balances for a user in one query (dashboard/API reads)."""
+        with self._db_lock:
+            rows = self._connect().execute(
+                "SELECT asset, amount FROM balances WHERE user_id=?", (user_id,)
+            ).fetchall()
+        return {asset: amount for asset, amount in rows if amount is not None}
+
     def get_balance(self, user_id: str, asset: str) -> float:
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("SELECT amount FROM balances WHERE user_id=? AND asset=?", (user_id, asset))
-        row = c.fetchone()
-        conn.close()
+        with self._db_lock:
+            row = self._connect().execute(
+                "SELECT amount FROM balances WHERE user_id=? AND asset=?", (user_id, asset)
+            ).fetchone()
         return row[0] if row else 0.0
-        
+
+    def _adjust_balance(self, c, user_id: str, asset: str, amount: float) -> None:
+        # Atomic upsert: increment in-place instead of read-then-replace.
+        # Caller owns the lock, the transaction and the commit, so several
+        # adjustments can batch into a single write.
+        c.execute(
+            "INSERT INTO balances (user_id, asset, amount) VALUES (?, ?, ?) "
+            "ON CONFLICT(user_id, asset) DO UPDATE SET amount = amount + excluded.amount",
+            (user_id, asset, amount),
+        )
+
     def deposit(self, user_id: str, asset: str, amount: float) -> str:
-        current = self.get_balance(user_id, asset)
-        new_balance = current + amount
-        
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("INSERT OR REPLACE INTO balances (user_id, asset, amount) VALUES (?, ?, ?)",
-                  (user_id, asset, new_balance))
-        conn.commit()
-        conn.close()
+        with self._db_lock:
+            conn = self._connect()
+            c = conn.cursor()
+            self._adjust_balance(c, user_id, asset, amount)
+            c.execute("SELECT amount FROM balances WHERE user_id=? AND asset=?", (user_id, asset))
+            new_balance = c.fetchone()[0]
+            conn.commit()
         self._snapshot_equity(user_id)
         return f"Deposited {amount} {asset}. New Balance: {new_balance}"
 
     def reset_wallet(self, user_id: str) -> str:
         """Clear all balances and trade history for a user in paper mode."""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute("DELETE FROM balances WHERE user_id=?", (user_id,))
-        c.execute("DELETE FROM orders WHERE user_id=?", (user_id,))
-        c.execute("DELETE FROM equity_snapshots WHERE user_id=?", (user_id,))
-        conn.commit()
-        conn.close()
+        with self._db_lock:
+            conn = self._connect()
+            c = conn.cursor()
+            c.execute("DELETE FROM balances WHERE user_id=?", (user_id,))
+            c.execute("DELETE FROM orders WHERE user_id=?", (user_id,))
+            c.execute("DELETE FROM equity_snapshots WHERE user_id=?", (user_id,))
+            conn.commit()
         return f"Paper wallet and history for {user_id} have been reset."
 
     def _parse_symbol(self, symbol: str) -> tuple[str, str]:
@@ -165,12 +228,7 @@ class PaperTradingEngine:
         e.g. "AAPL" -> ("AAPL", "USD")
         e.g. "BTC/USDT" -> ("BTC", "USDT")
         """
-        s = symbol.strip().upper()
-        if '/' in s:
-            parts = s.split('/', 1)
-            return parts[0], parts[1]
-        # For stocks, base is the ticker, quote is USD
-        return s, "USD"
+        return _split_symbol(symbol)
 
     def place_limit_order(self, user_id: str, side: str, symbol: str, amount: float, price: float) -> str:
         """
@@ -178,32 +236,35 @@ class PaperTradingEngine:
         """
         base, quote = self._parse_symbol(symbol)
         total_value = amount * price
-        
-        # Check simulated balance and reserve
-        if side == 'buy':
-            balance = self.get_balance(user_id, quote)
-            if balance < total_value:
-                return f"Insufficient fund. Have {balance} {quote}, need {total_value}"
-            # Lock funds (deduct now)
-            self.deposit(user_id, quote, -total_value)
-            
-        elif side == 'sell':
-            balance = self.get_balance(user_id, base)
-            if balance < amount:
-                return f"Insufficient fund. Have {balance} {base}, need {amount}"
-            # Lock funds
-            self.deposit(user_id, base, -amount)
-            
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute(
-            "INSERT INTO orders (user_id, side, symbol, amount, price, total_value, type, status) "
-            "VALUES (?, ?, ?, ?, ?, ?, 'limit', 'open')",
-            (user_id, side, symbol, amount, price, total_value),
-        )
-        order_id = c.lastrowid
-        conn.commit()
-        conn.close()
+
+        # Reservation and order row commit together.
+        with self._db_lock:
+            conn = self._connect()
+            c = conn.cursor()
+
+            # Check simulated balance and reserve
+            if side == 'buy':
+                balance = self.get_balance(user_id, quote)
+                if _insufficient(balance, total_value):
+                    return f"Insufficient fund. Have {balance} {quote}, need {total_value}"
+                # Lock funds (deduct now)
+                self._adjust_balance(c, user_id, quote, -total_value)
+
+            elif side == 'sell':
+                balance = self.get_balance(user_id, base)
+                if _insufficient(balance, amount):
+                    return f"Insufficient fund. Have {balance} {base}, need {amount}"
+                # Lock funds
+                self._adjust_balance(c, user_id, base, -amount)
+
+            c.execute(
+                "INSERT INTO orders (user_id, side, symbol, amount, price, total_value, type, status) "
+                "VALUES (?, ?, ?, ?, ?, ?, 'limit', 'open')",
+                (user_id, side, symbol, amount, price, total_value),
+            )
+            order_id = c.lastrowid
+            conn.commit()
+        self._snapshot_equity(user_id)
         return f"Order Placed: {side.upper()} {amount} {symbol} @ {price}. ID: {order_id}"
 
     def check_open_orders(self, symbol: str, current_price: float) -> List[str]:
@@ -211,46 +272,46 @@ class PaperTradingEngine:
         Check and fill open orders based on current price.
         Returns a list of messages for filled orders.
         """
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        # Find open orders for this symbol
-        c.execute(
-            "SELECT id, user_id, side, amount, price, total_value "
-            "FROM orders WHERE symbol=? AND status='open'",
-            (symbol,),
-        )
-        orders = c.fetchall()
-        
-        filled_msgs = []
-        base, quote = self._parse_symbol(symbol)
-        
-        for order in orders:
-            oid, uid, side, amt, price, val = order
-            
-            fill = False
-            if side == 'buy' and current_price <= price:
-                fill = True
-                # Give user the Base asset (Quote was deducted at placement)
-                self.deposit(uid, base, amt)
-                
-            elif side == 'sell' and current_price >= price:
-                fill = True
-                # Give user the Quote asset (Base was deducted at placement)
-                self.deposit(uid, quote, val) # val was amt * limit_price
-                
-            if fill:
-                c.execute("UPDATE orders SET status='filled' WHERE id=?", (oid,))
-                filled_msgs.append(f"Order #{oid} FILLED: {side.upper()} {amt} {symbol} @ {price}")
-                # Update derived price cache from the fill price (best available for metrics)
-                self._set_asset_price_usd(quote, 1.0 if quote.upper() in {"USDT", "USDC", "DAI", "USD"} else 1.0)
-                if quote.upper() in {"USDT", "USDC", "DAI", "USD"}:
-                    self._set_asset_price_usd(base, float(price))
-                self._snapshot_equity(uid)
-                
-        conn.commit()
-        conn.close()
+        with self._db_lock:
+            conn = self._connect()
+            c = conn.cursor()
+            # Find open orders for this symbol
+            c.execute(
+                "SELECT id, user_id, side, amount, price, total_value "
+                "FROM orders WHERE symbol=? AND status='open'",
+                (symbol,),
+            )
+            orders = c.fetchall()
+
+            filled_msgs = []
+            base, quote = self._parse_symbol(symbol)
+
+            for order in orders:
+                oid, uid, side, amt, price, val = order
+
+                fill = False
+                if side == 'buy' and current_price <= price:
+                    fill = True
+                    # Give user the Base asset (Quote was deducted at placement)
+                    self._adjust_balance(c, uid, base, amt)
+
+                elif side == 'sell' and current_price >= price:
+                    fill = True
+                    # Give user the Quote asset (Base was deducted at placement)
+                    self._adjust_balance(c, uid, quote, val) # val was amt * limit_price
+
+                if fill:
+                    c.execute("UPDATE orders SET status='filled' WHERE id=?", (oid,))
+                    filled_msgs.append(f"Order #{oid} FILLED: {side.upper()} {amt} {symbol} @ {price}")
+                    # Update derived price cache from the fill price (best available for metrics)
+                    self._set_asset_price_usd(quote, 1.0)
+                    if quote in _USD_STABLE:
+                        self._set_asset_price_usd(base, price)
+                    self._snapshot_equity(uid)
+
+            conn.commit()
         return filled_msgs
-        
+
     def execute_trade(
         self,
         user_id: str,
@@ -264,99 +325,151 @@ class PaperTradingEngine:
         Execute a paper trade.
         """
         base, quote = self._parse_symbol(symbol)
-        
+
         # If price is 0, try to fetch it from cache or mock
         if price <= 0:
             cached_price = self._get_asset_price_usd(base)
             if cached_price is None:
                 raise ValueError(f"Price for {base} is unknown and pulse price was not provided. Execution failed (Zero-Mock Policy).")
             price = cached_price
-        
-            
+
+
         total_value = amount * price
-        
-        # Check simulated balance
-        if side == 'buy':
-            # Need quote asset (USDT)
-            balance = self.get_balance(user_id, quote)
-            if balance < total_value:
-                return f"Insufficient fund. Have {balance} {quote}, need {total_value}"
-            
-            # Update balances
-            self.deposit(user_id, quote, -total_value)
-            self.deposit(user_id, base, amount)
-            
-        elif side == 'sell':
-            # Need base asset (BTC)
-            balance = self.get_balance(user_id, base)
-            if balance < amount:
-                return f"Insufficient fund. Have {balance} {base}, need {amount}"
-            
-            # Update balances
-            self.deposit(user_id, base, -amount)
-            self.deposit(user_id, quote, total_value)
-            
-        # Log order
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute(
-            "INSERT INTO orders (user_id, side, symbol, amount, price, total_value, rationale) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (user_id, side, symbol, amount, price, total_value, rationale),
-        )
-        conn.commit()
-        conn.close()
 
-        # Update derived price cache (if quote looks like USD stable)
-        if quote.upper() in {"USDT", "USDC", "DAI", "USD"}:
-            self._set_asset_price_usd(base, float(price))
-            self._set_asset_price_usd(quote, 1.0)
+        # One transaction for the whole trade: balance check, both balance
+        # adjustments, the order row and the price-cache update used to commit
+        # separately (up to eight commits via the nested deposit calls).
+        with self._db_lock:
+            conn = self._connect()
+            c = conn.cursor()
+
+            if side == 'buy':
+                # Need quote asset (USDT)
+                balance = self.get_balance(user_id, quote)
+                if _insufficient(balance, total_value):
+                    return f"Insufficient fund. Have {balance} {quote}, need {total_value}"
+
+                # Update balances
+                self._adjust_balance(c, user_id, quote, -total_value)
+                self._adjust_balance(c, user_id, base, amount)
+
+            elif side == 'sell':
+                # Need base asset (BTC)
+                balance = self.get_balance(user_id, base)
+                if _insufficient(balance, amount):
+                    return f"Insufficient fund. Have {balance} {base}, need {amount}"
+
+                # Update balances
+                self._adjust_balance(c, user_id, base, -amount)
+                self._adjust_balance(c, user_id, quote, total_value)
+
+            # Log order
+            c.execute(
+                "INSERT INTO orders (user_id, side, symbol, amount, price, total_value, rationale) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (user_id, side, symbol, amount, price, total_value, rationale),
+            )
+
+            # Update derived price cache (if quote looks like USD stable)
+            if quote in _USD_STABLE and price > 0:
+                now_iso = self._now_iso()
+                c.execute(
+                    "INSERT OR REPLACE INTO asset_prices (asset, price_usd, updated_at) VALUES (?, ?, ?)",
+                    (base, price, now_iso),
+                )
+                c.execute(
+                    "INSERT OR REPLACE INTO asset_prices (asset, price_usd, updated_at) VALUES (?, ?, ?)",
+                    (quote, 1.0, now_iso),
+                )
+            conn.commit()
         self._snapshot_equity(user_id)
-        
+
         return (
             f"Paper Trade Executed: {side.upper()} {amount} {symbol} @ {price}. "
             f"Value: {total_value} {quote}. Rationale: {rationale}"
         )
 
+    def snapshot(self, user_id: str) -> Dict[str, object]:
+        """
+        Batched read of account state for one tool invocation.
+
+        Returns {'metrics': ..., 'portfolio_value': ...} computed over a single
+        locked read instead of one round-trip per lookup (get_risk_metrics,
+        get_portfolio_value_usd and the per-asset price reads each take their own).
+        """
+        with self._db_lock:
+            conn = self._connect()
+            c = conn.cursor()
+
+            # Mark-to-market portfolio value in one pass (join balances with cached prices)
+            c.execute(
+                """
+                SELECT b.asset, b.amount, p.price_usd
+                FROM balances b LEFT JOIN asset_prices p ON p.asset = b.asset
+                WHERE b.user_id=?
+                """,
+                (user_id,),
+            )
+            total = 0.0
+            for asset, amount, px in c.fetchall():
+                if amount is None:
+                    continue
+                if px is None:
+                    px = 1.0 if str(asset).upper() in _USD_STABLE else None
+                if px is None:
+                    continue
+                total += amount * px
+
+            c.execute(
+                "SELECT timestamp, equity_usd FROM equity_snapshots WHERE user_id=? ORDER BY timestamp ASC",
+                (user_id,),
+            )
+            rows = c.fetchall()
+
+        return {
+            "metrics": self._risk_metrics_from_rows(rows),
+            "portfolio_value": total,
+        }
+
     def get_risk_metrics(self, user_id: str) -> Dict[str, float]:
         """
         Calculate risk metrics for the user.
         Returns: { 'daily_pnl_pct': float, 'drawdown_pct': float }
         """
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute(
-            "SELECT timestamp, equity_usd FROM equity_snapshots WHERE user_id=? ORDER BY timestamp ASC",
-            (user_id,),
-        )
-        rows = c.fetchall()
-        conn.close()
+        with self._db_lock:
+            rows = self._connect().execute(
+                "SELECT timestamp, equity_usd FROM equity_snapshots WHERE user_id=? ORDER BY timestamp ASC",
+                (user_id,),
+            ).fetchall()
+        return self._risk_metrics_from_rows(rows)
 
+    def _risk_metrics_from_rows(self, rows: List[tuple]) -> Dict[str, float]:
         if not rows:
             return {"daily_pnl_pct": 0.0, "drawdown_pct": 0.0}
 
+        # equity_usd is a REAL column, so sqlite3 yields floats directly; no
+        # per-row re-coercion needed in this scan.
         # Compute drawdown (fraction, e.g. 0.10 for 10%)
-        peak = float(rows[0][1])
+        peak = rows[0][1]
         trough_drawdown = 0.0
         for _, eq in rows:
-            eqv = float(eq)
-            if eqv > peak:
-                peak = eqv
+            if eq > peak:
+                peak = eq
             if peak > 0:
-                dd = (peak - eqv) / peak
+                dd = (peak - eq) / peak
                 if dd > trough_drawdown:
                     trough_drawdown = dd
 
         # Daily PnL%: compare last snapshot vs first snapshot of current UTC day
         today = self._now_iso()[:10]  # YYYY-MM-DD
-        start_equity = float(rows[0][1])
+        start_equity = rows[0][1]
         for ts, eq in rows:
             if str(ts).startswith(today):
-                start_equity = float(eq)
+                start_equity = eq
                 break
-        end_equity = float(rows[-1][1])
+        end_equity = rows[-1][1]
         daily_pct = 0.0
         if start_equity > 0:
             daily_pct = (end_equity - start_equity) / start_equity
 
-        return {"daily_pnl_pct": float(daily_pct), "drawdown_pct": float(trough_drawdown)}
+        return {"daily_pnl_pct": daily_pct, "drawdown_pct": trough_drawdown}
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional
 
 
 @dataclass
@@ -12,20 +13,36 @@ class PolicyError(Exception):
     data: Dict[str, Any]
 
 
-def _parse_csv_set(value: Optional[str]) -> Set[str]:
+# Compiled once at import; per-order validation does membership tests only.
+_VALID_SIDES: FrozenSet[str] = frozenset({"buy", "sell"})
+_VALID_ORDER_TYPES: FrozenSet[str] = frozenset({"market", "limit"})
+
+
+@lru_cache(maxsize=64)
+def _parse_csv_set(value: Optional[str]) -> FrozenSet[str]:
+    # Memoized on the raw env string: allowlists rarely change, so repeated
+    # validations skip the split/strip work while still seeing env updates.
     if not value:
-        return set()
-    return {v.strip().lower() for v in value.split(",") if v.strip()}
+        return frozenset()
+    return frozenset(v.strip().lower() for v in value.split(",") if v.strip())
 
 
-def _env_float(name: str, default: Optional[float] = None) -> Optional[float]:
-    raw = os.getenv(name)
-    if raw is None or raw == "":
-        return default
+@lru_cache(maxsize=32)
+def _parse_float(raw: str) -> Optional[float]:
+    # Memoized on the raw env string (same idea as _parse_csv_set): limits
+    # rarely change, so repeated validations skip the float() conversion.
     try:
         return float(raw)
     except ValueError:
+        return None
+
+
+def _env_float(name: str, default: Optional[float] = None) -> Optional[float]:
+    raw = os.getenv(name)
+    if raw is None or raw == "":
         return default
+    parsed = _parse_float(raw)
+    return default if parsed is None else parsed
 
 
 class PolicyEngine:
@@ -97,10 +114,10 @@ class PolicyEngine:
                 data={"symbol": symbol, "allow_tickers": sorted(allow_symbols)},
             )
 
-        if sd not in {"buy", "sell"}:
+        if sd not in _VALID_SIDES:
             raise PolicyError("invalid_side", "side must be 'buy' or 'sell'", {"side": side})
         
-        if ot not in {"market", "limit"}:
+        if ot not in _VALID_ORDER_TYPES:
             raise PolicyError(
                 "invalid_order_type",
                 "order_type must be 'market' or 'limit'",
@@ -5,6 +5,7 @@ import statistics
 from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 import ta
 from RestrictedPython import compile_restricted, safe_globals, utility_builtins
@@ -86,10 +87,17 @@ def _compute_equity_curve(
 
     equity_curve: List[float] = []
 
-    for i, row in df.iterrows():
-        price = float(row["close"])
-        rsi = row.get("rsi")
-        if pd.isna(rsi):
+    # SoA extraction: this loop runs once per scenario (hundreds per stress
+    # test), so candles are read from contiguous numpy columns instead of
+    # re-boxing each row into a Series via iterrows().
+    closes = df["close"].to_numpy(dtype=float)
+    rsis = df["rsi"].to_numpy(dtype=float) if "rsi" in df.columns else np.full(len(df), np.nan)
+    timestamps = df["timestamp"].astype(str).to_numpy()
+
+    for i in range(len(closes)):
+        price = float(closes[i])
+        rsi = rsis[i]
+        if np.isnan(rsi):
             equity = capital if capital > 0 else position * price
             equity_curve.append(float(equity))
             continue
@@ -103,11 +111,11 @@ def _compute_equity_curve(
             qty = capital / price
             position = qty
             capital = 0.0
-            trades.append({"type": "buy", "price": price, "idx": int(i), "ts": str(row["timestamp"])})
+            trades.append({"type": "buy", "price": price, "idx": i, "ts": timestamps[i]})
         elif action == "sell" and position > 0:
             capital = position * price
             position = 0.0
-            trades.append({"type": "sell", "price": price, "idx": int(i), "ts": str(row["timestamp"])})
+            trades.append({"type": "sell", "price": price, "idx": i, "ts": timestamps[i]})
 
         equity = capital if capital > 0 else position * price
         equity_curve.append(float(equity))
@@ -32,15 +32,18 @@ class SchwabBrokerage(IBrokerage):
         self.base_url = os.getenv("SCHWAB_BASE_URL", "https://api.schwabapi.com/trader/v1")
         self.access_token = os.getenv("SCHWAB_ACCESS_TOKEN")
         self._available = bool(self.access_token)
+        # The token is fixed for the instance lifetime, so the header dict is
+        # built once instead of per request.
+        self._request_headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "Accept": "application/json"
+        }
 
     def is_available(self) -> bool:
         return self._available
 
     def _headers(self):
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            "Accept": "application/json"
-        }
+        return self._request_headers
 
     def place_order(self, symbol: str, side: str, qty: float, order_type: str = "market", price: Optional[float] = None) -> Dict[str, Any]:
         if not self._available:
@@ -162,8 +165,10 @@ class EtradeBrokerage(IBrokerage):
         self.resource_owner_secret = os.getenv("ETRADE_RESOURCE_OWNER_SECRET") # Access Secret
         
         self.base_url = "https://api.etrade.com/v1/market" # Prod
+        self.accounts_base_url = "https://api.etrade.com/v1/accounts"
         if os.getenv("ETRADE_SANDBOX") == "true":
             self.base_url = "https://apisb.etrade.com/v1/market"
+            self.accounts_base_url = "https://apisb.etrade.com/v1/accounts"
             
         self._available = bool(
             self.consumer_key and self.consumer_secret and 
@@ -179,6 +184,12 @@ class EtradeBrokerage(IBrokerage):
                 resource_owner_key=self.resource_owner_key,
                 resource_owner_secret=self.resource_owner_secret
             )
+            # OAuth1Session is a requests.Session; mount a pooled adapter so
+            # back-to-back order/balance calls reuse TLS connections.
+            self.session.mount(
+                "https://",
+                requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16, pool_block=False),
+            )
 
     def is_available(self) -> bool:
         return self._available
@@ -216,10 +227,9 @@ class EtradeBrokerage(IBrokerage):
         if price:
             payload["PlaceOrderRequest"]["Order"]["limitPrice"] = price
 
-        # We need the URL for accounts
-        url = f"https://api.etrade.com/v1/accounts/{account_id_key}/orders/place.json"
-        if os.getenv("ETRADE_SANDBOX") == "true":
-             url = f"https://apisb.etrade.com/v1/accounts/{account_id_key}/orders/place.json"
+        # Accounts endpoint is resolved once in __init__ (sandbox vs prod is
+        # invariant for the lifetime of the brokerage instance).
+        url = f"{self.accounts_base_url}/{account_id_key}/orders/place.json"
 
         try:
             resp = self.session.post(url, json=payload, headers={"Content-Type": "application/json"})
@@ -247,7 +257,7 @@ class EtradeBrokerage(IBrokerage):
              return {"equity": 0.0, "cash": 0.0}
         
         account_id_key = os.getenv("ETRADE_ACCOUNT_ID_KEY")
-        url = f"https://api.etrade.com/v1/accounts/{account_id_key}/balance.json"
+        url = f"{self.accounts_base_url}/{account_id_key}/balance.json"
         
         try:
             resp = self.session.get(url, params={"instType": "BROKERAGE"})
@@ -11,25 +11,36 @@ from __future__ import annotations
 import os
 import random
 import time
-from typing import Callable, TypeVar
+from functools import lru_cache
+from typing import Callable, Tuple, TypeVar
 
 from common.errors import AppError, classify_exception
 
 T = TypeVar("T")
 
 
-def _env_int(name: str, default: int) -> int:
+@lru_cache(maxsize=16)
+def _retry_settings(raw_attempts: str, raw_base: str, raw_max: str) -> Tuple[int, float, float]:
+    """
+    Parse and clamp retry tuning, memoized on the raw env strings so the
+    per-call cost is a dict lookup unless the operator changes the values.
+    """
     try:
-        return int((os.getenv(name) or "").strip() or default)
+        attempts = int(raw_attempts.strip() or 3)
     except Exception:
-        return default
-
-
-def _env_float(name: str, default: float) -> float:
+        attempts = 3
+    try:
+        base = float(raw_base.strip() or 0.5)
+    except Exception:
+        base = 0.5
     try:
-        return float((os.getenv(name) or "").strip() or default)
+        max_delay = float(raw_max.strip() or 5.0)
     except Exception:
-        return default
+        max_delay = 5.0
+    attempts = max(1, attempts)
+    base = max(0.05, base)
+    max_delay = max(base, max_delay)
+    return attempts, base, max_delay
 
 
 def should_retry(e: Exception) -> bool:
@@ -51,9 +62,11 @@ def with_retry(op: str, fn: Callable[[], T]) -> T:
     - BROKERAGE_RETRY_BASE_DELAY_SEC (default 0.5)
     - BROKERAGE_RETRY_MAX_DELAY_SEC (default 5.0)
     """
-    max_attempts = max(1, _env_int("BROKERAGE_RETRY_MAX_ATTEMPTS", 3))
-    base = max(0.05, _env_float("BROKERAGE_RETRY_BASE_DELAY_SEC", 0.5))
-    max_delay = max(base, _env_float("BROKERAGE_RETRY_MAX_DELAY_SEC", 5.0))
+    max_attempts, base, max_delay = _retry_settings(
+        os.getenv("BROKERAGE_RETRY_MAX_ATTEMPTS") or "",
+        os.getenv("BROKERAGE_RETRY_BASE_DELAY_SEC") or "",
+        os.getenv("BROKERAGE_RETRY_MAX_DELAY_SEC") or "",
+    )
 
     attempt = 0
     last_exc: Exception | None = None
@@ -4,6 +4,7 @@ import os
 from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from execution.base import IBrokerage
 
@@ -17,9 +18,27 @@ class TradierBrokerage(IBrokerage):
         self.account_id = os.getenv("TRADIER_ACCOUNT_ID")
         self.sandbox = os.getenv("TRADIER_SANDBOX", "true").lower() == "true"
         self.base_url = "https://sandbox.tradier.com/v1" if self.sandbox else "https://api.tradier.com/v1"
-        
+
         self._available = bool(self.token and self.account_id)
 
+        # Account identity is immutable for the life of the instance, so the
+        # account-scoped endpoint URLs are built once here rather than
+        # re-formatted on every order/balance/position call.
+        account_url = f"{self.base_url}/accounts/{self.account_id}"
+        self._orders_url = f"{account_url}/orders"
+        self._balances_url = f"{account_url}/balances"
+        self._positions_url = f"{account_url}/positions"
+
+        # Persistent session: keeps the TCP/TLS connection alive across calls
+        # instead of paying a full handshake per order/balance request.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, pool_block=False)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Authorization": f"Bearer {self.token}",
+            "Accept": "application/json"
+        })
+
     def is_available(self) -> bool:
         return self._available
 
@@ -33,7 +52,6 @@ class TradierBrokerage(IBrokerage):
         if not self._available:
              raise RuntimeError("Tradier API keys not configured.")
              
-        url = f"{self.base_url}/accounts/{self.account_id}/orders"
         data = {
             "class": "equity",
             "symbol": symbol,
@@ -45,7 +63,7 @@ class TradierBrokerage(IBrokerage):
         if order_type == "limit":
             data["price"] = price
 
-        response = requests.post(url, data=data, headers=self._headers(), timeout=10)
+        response = self.session.post(self._orders_url, data=data, timeout=10)
         res_json = response.json()
         
         if response.status_code != 200:
@@ -54,7 +72,9 @@ class TradierBrokerage(IBrokerage):
         order_info = res_json.get("order", {})
         return {
             "id": str(order_info.get("id")),
-            "status": "submitted",
+            # Tradier reports the order state inline; surface it so callers
+            # don't need a follow-up status round trip.
+            "status": str(order_info.get("status") or "submitted"),
             "symbol": symbol,
             "qty": qty,
             "side": side,
@@ -65,8 +85,7 @@ class TradierBrokerage(IBrokerage):
         if not self._available:
              raise RuntimeError("Tradier API keys not configured.")
              
-        url = f"{self.base_url}/accounts/{self.account_id}/balances"
-        response = requests.get(url, headers=self._headers(), timeout=10)
+        response = self.session.get(self._balances_url, timeout=10)
         res_json = response.json()
         
         bal = res_json.get("balances", {})
@@ -80,8 +99,7 @@ class TradierBrokerage(IBrokerage):
         if not self._available:
              raise RuntimeError("Tradier API keys not configured.")
              
-        url = f"{self.base_url}/accounts/{self.account_id}/positions"
-        response = requests.get(url, headers=self._headers(), timeout=10)
+        response = self.session.get(self._positions_url, timeout=10)
         res_json = response.json()
         
         positions = res_json.get("positions", {}).get("position", [])
@@ -1,6 +1,7 @@
 import os
 import time
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
@@ -78,10 +79,9 @@ def fetch_rss_news(symbol: str = "") -> str:
         ("MarketWatch", "https://www.marketwatch.com/rss/marketupdate"),
         ("Yahoo Finance", "https://finance.yahoo.com/news/rssindex")
     ]
-    
-    all_headlines = []
-    
-    for name, url in feeds:
+
+    def _fetch_feed(name: str, url: str) -> List[str]:
+        headlines: List[str] = []
         try:
             feed = feedparser.parse(url)
             # Take top 3 from each
@@ -92,12 +92,20 @@ def fetch_rss_news(symbol: str = "") -> str:
                 # If symbol is provided, check if it's in the title/summary (case-insensitive)
                 if symbol and symbol.lower() not in entry.title.lower() and symbol.lower() not in (getattr(entry, 'summary', '')).lower():
                     continue
-                
-                all_headlines.append(f"{entry.title} ({name})")
+
+                headlines.append(f"{entry.title} ({name})")
                 count += 1
         except Exception as e:
-            all_headlines.append(f"Error fetching {name} feed: {str(e)}")
-            
+            headlines.append(f"Error fetching {name} feed: {str(e)}")
+        return headlines
+
+    # The feeds are independent remote fetches; pulling them concurrently
+    # bounds the latency to the slowest feed instead of the sum. Results are
+    # merged in feed-list order so the output is unchanged.
+    with ThreadPoolExecutor(max_workers=len(feeds), thread_name_prefix="rss-feed") as pool:
+        futures = [pool.submit(_fetch_feed, name, url) for name, url in feeds]
+        all_headlines = [h for fut in futures for h in fut.result()]
+
     if not all_headlines:
         return f"No RSS news found matching '{symbol}' or feeds unavailable."
         
@@ -133,6 +141,57 @@ def get_cached_sentiment_score(symbol: str) -> float:
         return entry['score']
     return 0.0
 
+def _twitter_sentiment(symbol: str) -> Tuple[str, List[str], float]:
+    """Returns (result line, rationales, score delta) for the X/Twitter probe."""
+    twitter_bearer = os.getenv("TWITTER_BEARER_TOKEN")
+    if not (twitter_bearer and tweepy):
+        return "Twitter: Not Configured.", [], 0.0
+    try:
+        client = tweepy.Client(bearer_token=twitter_bearer)
+        # Simple search for recent tweets (read-only)
+        query = f"{symbol} -is:retweet lang:en"
+        tweets = client.search_recent_tweets(query=query, max_results=10)
+        if tweets.data:
+            texts = [t.text for t in tweets.data]
+            preview = " | ".join([t[:50] + "..." for t in texts[:2]])
+            return (
+                f"Twitter: Found {len(texts)} recent tweets. Preview: {preview}",
+                [f"Twitter volume alert for {symbol}"],
+                0.2,
+            )
+        return "Twitter: No recent tweets found.", [], 0.0
+    except Exception as e:
+        return f"Twitter Error: {str(e)}", [], 0.0
+
+
+def _reddit_sentiment(symbol: str) -> Tuple[str, List[str], float]:
+    """Returns (result line, rationales, score delta) for the Reddit probe."""
+    reddit_id = os.getenv("REDDIT_CLIENT_ID")
+    reddit_secret = os.getenv("REDDIT_CLIENT_SECRET")
+    if not (reddit_id and reddit_secret and praw):
+        return "Reddit: Not Configured.", [], 0.0
+    try:
+        reddit = praw.Reddit(
+            client_id=reddit_id,
+            client_secret=reddit_secret,
+            user_agent="readytrader_stocks/1.0"
+        )
+        # Search r/stocks or r/wallstreetbets
+        subreddit = reddit.subreddit("stocks+wallstreetbets")
+        posts = subreddit.search(symbol, limit=5, time_filter="day")
+        titles = [p.title for p in posts]
+        if titles:
+            preview = " | ".join(titles[:2])
+            return (
+                f"Reddit: Found {len(titles)} posts. Preview: {preview}",
+                ["Reddit active discussion in r/stocks"],
+                0.2,
+            )
+        return "Reddit: No recent posts found.", [], 0.0
+    except Exception as e:
+        return f"Reddit Error: {str(e)}", [], 0.0
+
+
 def analyze_social_sentiment(symbol: str) -> str:
     """
     Analyze social sentiment using Tweepy (X) or PRAW (Reddit) if configured.
@@ -140,57 +199,18 @@ def analyze_social_sentiment(symbol: str) -> str:
     # Check cache first (optional, but good for speed)
     # But usually this tool is called explicitly to Refresh.
     # Let's refresh every time this tool is CALLED, but get_cached_sentiment_score uses what's there.
-    
-    score = 0.0
-    rationales = []
-    
-    # 1. Twitter / X Analysis
-    twitter_bearer = os.getenv("TWITTER_BEARER_TOKEN")
-    twitter_result = "Twitter: Not Configured."
-    
-    if twitter_bearer and tweepy:
-        try:
-            client = tweepy.Client(bearer_token=twitter_bearer)
-            # Simple search for recent tweets (read-only)
-            query = f"{symbol} -is:retweet lang:en"
-            tweets = client.search_recent_tweets(query=query, max_results=10)
-            if tweets.data:
-                texts = [t.text for t in tweets.data]
-                preview = " | ".join([t[:50] + "..." for t in texts[:2]])
-                twitter_result = f"Twitter: Found {len(texts)} recent tweets. Preview: {preview}"
-                rationales.append(f"Twitter volume alert for {symbol}")
-                score += 0.2
-            else:
-                twitter_result = "Twitter: No recent tweets found."
-        except Exception as e:
-            twitter_result = f"Twitter Error: {str(e)}"
 
-    # 2. Reddit Analysis
-    reddit_id = os.getenv("REDDIT_CLIENT_ID")
-    reddit_secret = os.getenv("REDDIT_CLIENT_SECRET")
-    reddit_result = "Reddit: Not Configured."
-    
-    if reddit_id and reddit_secret and praw:
-        try:
-            reddit = praw.Reddit(
-                client_id=reddit_id,
-                client_secret=reddit_secret,
-                user_agent="readytrader_stocks/1.0"
-            )
-            # Search r/stocks or r/wallstreetbets
-            subreddit = reddit.subreddit("stocks+wallstreetbets")
-            posts = subreddit.search(symbol, limit=5, time_filter="day")
-            titles = [p.title for p in posts]
-            if titles:
-                preview = " | ".join(titles[:2])
-                reddit_result = f"Reddit: Found {len(titles)} posts. Preview: {preview}"
-                rationales.append("Reddit active discussion in r/stocks")
-                score += 0.2
-            else:
-                reddit_result = "Reddit: No recent posts found."
-        except Exception as e:
-            reddit_result = f"Reddit Error: {str(e)}"
-            
+    # The two probes are independent network calls; overlapping them makes
+    # the tool latency max(twitter, reddit) instead of their sum.
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="social-sentiment") as pool:
+        twitter_fut = pool.submit(_twitter_sentiment, symbol)
+        reddit_fut = pool.submit(_reddit_sentiment, symbol)
+        twitter_result, twitter_rationales, twitter_score = twitter_fut.result()
+        reddit_result, reddit_rationales, reddit_score = reddit_fut.result()
+
+    score = twitter_score + reddit_score
+    rationales = twitter_rationales + reddit_rationales
+
     # Combine
     final_output = f"{twitter_result}\n{reddit_result}"
     
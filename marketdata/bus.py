@@ -6,6 +6,7 @@ import os
 import threading
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from .providers import MarketDataProvider
@@ -23,20 +24,42 @@ def _now_ms() -> int:
     return int(time.time() * 1000)
 
 
-def _env_int(name: str, default: int) -> int:
+# Parses are memoized on the raw env string: these thresholds are read on
+# every fetch but change rarely, so repeated calls skip the strip/convert
+# while still picking up env updates.
+@lru_cache(maxsize=64)
+def _parse_int(raw: str, default: int) -> int:
     try:
-        return int((os.getenv(name) or "").strip() or default)
+        return int(raw.strip() or default)
     except Exception:
         return default
 
 
-def _env_float(name: str, default: float) -> float:
+@lru_cache(maxsize=64)
+def _parse_float(raw: str, default: float) -> float:
     try:
-        return float((os.getenv(name) or "").strip() or default)
+        return float(raw.strip() or default)
     except Exception:
         return default
 
 
+@lru_cache(maxsize=16)
+def _parse_bool(raw: str) -> bool:
+    return raw.strip().lower() == "true"
+
+
+def _env_int(name: str, default: int) -> int:
+    return _parse_int(os.getenv(name) or "", default)
+
+
+def _env_float(name: str, default: float) -> float:
+    return _parse_float(os.getenv(name) or "", default)
+
+
+def _env_bool(name: str) -> bool:
+    return _parse_bool(os.getenv(name) or "")
+
+
 def _priority_map(providers: List[MarketDataProvider]) -> Dict[str, int]:
     """
     Compute a provider_id -> priority mapping.
@@ -74,6 +97,13 @@ def _priority_map(providers: List[MarketDataProvider]) -> Dict[str, int]:
     return out
 
 
+@lru_cache(maxsize=64)
+def _max_age_env_key(provider_id: str) -> str:
+    # The env-var name is rebuilt for every provider on every fetch otherwise;
+    # the provider-id universe is tiny, so memoize the f-string.
+    return f"MARKETDATA_MAX_AGE_MS_{provider_id.upper()}"
+
+
 def _max_age_ms_for(provider_id: str) -> int:
     """
     Staleness threshold. If age_ms <= threshold, data is considered fresh.
@@ -83,26 +113,29 @@ def _max_age_ms_for(provider_id: str) -> int:
     - MARKETDATA_MAX_AGE_MS_<PROVIDERID> (e.g. MARKETDATA_MAX_AGE_MS_EXCHANGE_WS)
     """
     default_ms = _env_int("MARKETDATA_MAX_AGE_MS", 30_000)
-    key = f"MARKETDATA_MAX_AGE_MS_{provider_id.upper()}"
-    return _env_int(key, default_ms)
+    return _env_int(_max_age_env_key(provider_id), default_ms)
 
 
-def _sane_ticker(t: Dict[str, Any]) -> Tuple[bool, str]:
+def _sane_ticker(t: Dict[str, Any]) -> Tuple[bool, str, float]:
+    """
+    Validate a ticker dict; also returns the parsed `last` price so callers
+    don't have to re-parse it (0.0 when invalid).
+    """
     try:
         last = float(t.get("last") or 0.0)
         if last <= 0.0:
-            return False, "invalid_last"
-        bid = t.get("bid")
-        ask = t.get("ask")
-        if bid is not None and float(bid) <= 0.0:
-            return False, "invalid_bid"
-        if ask is not None and float(ask) <= 0.0:
-            return False, "invalid_ask"
-        if bid is not None and ask is not None and float(ask) < float(bid):
-            return False, "ask_lt_bid"
-        return True, "ok"
+            return False, "invalid_last", last
+        bid = float(t["bid"]) if t.get("bid") is not None else None
+        ask = float(t["ask"]) if t.get("ask") is not None else None
+        if bid is not None and bid <= 0.0:
+            return False, "invalid_bid", last
+        if ask is not None and ask <= 0.0:
+            return False, "invalid_ask", last
+        if bid is not None and ask is not None and ask < bid:
+            return False, "ask_lt_bid", last
+        return True, "ok", last
     except Exception:
-        return False, "ticker_parse_error"
+        return False, "ticker_parse_error", 0.0
 
 
 def _extract_ts_ms(t: Dict[str, Any]) -> Optional[int]:
@@ -132,23 +165,40 @@ class MarketDataBus:
     def __init__(self, providers: List[MarketDataProvider]) -> None:
         self._providers = list(providers)
         self._priority = _priority_map(self._providers)
+        # Cached priority-sorted view of _providers (see _providers_by_priority).
+        self._sorted_cache: Optional[Tuple[int, int, List[MarketDataProvider]]] = None
         self._lock = threading.Lock()
         # symbol -> (last, ts_ms) for cheap outlier checks without fetching multiple sources
         self._last_good: Dict[str, Tuple[float, int]] = {}
 
+    def _providers_by_priority(self) -> List[MarketDataProvider]:
+        """
+        Priority-sorted view of _providers, cached on the list's identity and
+        length so the per-fetch sort (lambda key and all) only reruns when the
+        provider set actually changes.
+        """
+        providers = self._providers
+        cached = self._sorted_cache
+        if cached is not None and cached[0] == id(providers) and cached[1] == len(providers):
+            return cached[2]
+        ordered = sorted(providers, key=lambda p: self._priority.get(p.provider_id, 9))
+        self._sorted_cache = (id(providers), len(providers), ordered)
+        return ordered
+
     async def fetch_ticker(self, symbol: str) -> MarketDataResult:
         sym = (symbol or "").strip().upper()
         now_ms = _now_ms()
 
         # Operator config: optionally fail closed for execution usage.
-        enforce_fresh = (os.getenv("MARKETDATA_FAIL_CLOSED", "false").strip().lower() == "true")
+        enforce_fresh = _env_bool("MARKETDATA_FAIL_CLOSED")
 
         # Outlier detection config
         outlier_pct = _env_float("MARKETDATA_OUTLIER_MAX_PCT", 20.0)
         outlier_window_ms = _env_int("MARKETDATA_OUTLIER_WINDOW_MS", 10_000)
 
-        providers = sorted(self._providers, key=lambda p: self._priority.get(p.provider_id, 9))
+        providers = self._providers_by_priority()
         candidates: List[Dict[str, Any]] = []
+        fetched: Dict[str, Dict[str, Any]] = {}
         chosen: Optional[Dict[str, Any]] = None
         last_err: Exception | None = None
 
@@ -159,7 +209,7 @@ class MarketDataBus:
             pid = p.provider_id
             try:
                 t = await p.fetch_ticker(sym)
-                ok, reason = _sane_ticker(t)
+                ok, reason, last_px = _sane_ticker(t)
                 ts_ms = _extract_ts_ms(t)
                 age_ms = (now_ms - ts_ms) if ts_ms is not None else None
                 max_age_ms = _max_age_ms_for(pid)
@@ -173,9 +223,12 @@ class MarketDataBus:
                     "age_ms": age_ms,
                     "max_age_ms": max_age_ms,
                     "stale": stale,
-                    "last": float(t.get("last") or 0.0),
+                    "last": last_px,
                 }
                 candidates.append(cand)
+                # Keep the ticker payload so best-effort selection below does
+                # not have to refetch from the same provider.
+                fetched[pid] = t
                 if ok and not stale and chosen is None:
                     chosen = {"provider_id": pid, "ticker": t, "age_ms": age_ms, "timestamp_ms": ts_ms}
                     break
@@ -221,10 +274,14 @@ class MarketDataBus:
                         best_pid, best_age = pid, age
 
             if best_pid is not None:
-                # refetch to return the full payload
-                p2 = next((p for p in providers if p.provider_id == best_pid), None)
-                if p2 is not None:
-                    best_ticker = await p2.fetch_ticker(sym)
+                # Reuse the payload from the first pass; only refetch if it
+                # was somehow not retained (avoids a redundant provider call).
+                best_ticker = fetched.get(best_pid)
+                if best_ticker is None:
+                    p2 = next((p for p in providers if p.provider_id == best_pid), None)
+                    if p2 is not None:
+                        best_ticker = await p2.fetch_ticker(sym)
+                if best_ticker is not None:
                     best_ts = _extract_ts_ms(best_ticker)
                     best_age = (now_ms - best_ts) if best_ts is not None else None
                     chosen = {
@@ -244,25 +301,25 @@ class MarketDataBus:
         max_age_ms = _max_age_ms_for(provider_id)
         stale = (age_ms is None) or (age_ms > max_age_ms)
 
-        # Cheap outlier check vs last good value
+        # Cheap outlier check vs last good value. Providers normalize "last"
+        # to a number, so an isinstance guard replaces the old broad
+        # try/except (no path below can raise).
         outlier = False
         outlier_reason = None
-        try:
-            last = float(ticker.get("last") or 0.0)
+        raw_last = ticker.get("last")
+        last = float(raw_last) if isinstance(raw_last, (int, float)) else 0.0
+        with self._lock:
+            prev = self._last_good.get(sym)
+        if prev is not None and ts_ms is not None:
+            prev_last, prev_ts = prev
+            if (now_ms - prev_ts) <= outlier_window_ms and prev_last > 0:
+                pct = abs((last - prev_last) / prev_last) * 100.0
+                if pct > outlier_pct:
+                    outlier = True
+                    outlier_reason = f"pct_move_{round(pct, 3)}"
+        if not stale and not outlier and ts_ms is not None:
             with self._lock:
-                prev = self._last_good.get(sym)
-            if prev is not None and ts_ms is not None:
-                prev_last, prev_ts = prev
-                if (now_ms - prev_ts) <= outlier_window_ms and prev_last > 0:
-                    pct = abs((last - prev_last) / prev_last) * 100.0
-                    if pct > outlier_pct:
-                        outlier = True
-                        outlier_reason = f"pct_move_{round(pct, 3)}"
-            if not stale and not outlier and ts_ms is not None:
-                with self._lock:
-                    self._last_good[sym] = (last, ts_ms)
-        except Exception:
-            _ = False
+                self._last_good[sym] = (last, ts_ms)
 
         if enforce_fresh and (stale or outlier):
             raise ValueError(
@@ -301,7 +358,7 @@ class MarketDataBus:
 
     def status(self) -> Dict[str, Any]:
         providers = []
-        for p in sorted(self._providers, key=lambda x: self._priority.get(x.provider_id, 9)):
+        for p in self._providers_by_priority():
             try:
                 providers.append(
                     {
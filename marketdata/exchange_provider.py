@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import os
 import time
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
@@ -32,6 +34,29 @@ def _seconds_to_next_boundary(period_sec: int) -> int:
         return 0
     return period_sec - (now % period_sec)
 
+
+# Memoized on the raw env string (same idea as the bus/policy env parsers):
+# cache TTLs are read on every fetch but change rarely.
+@lru_cache(maxsize=16)
+def _parse_ttl(raw: str, default: float) -> float:
+    try:
+        return float(raw.strip() or default)
+    except Exception:
+        return default
+
+
+def _env_ttl(name: str, default: float) -> float:
+    return _parse_ttl(os.getenv(name) or "", default)
+
+
+# Timeframe -> yfinance request shape, compiled once instead of re-branching
+# per fetch. Unknown timeframes fall back to (timeframe, "1mo").
+_YF_REQUEST_SHAPE: Dict[str, Tuple[str, str]] = {
+    "1m": ("1m", "5d"),
+    "1h": ("1h", "1mo"),
+    "1d": ("1d", "1y"),
+}
+
 class ExchangeProvider:
     """
     Market-data connector layer (yfinance) for Stocks:
@@ -46,7 +71,17 @@ class ExchangeProvider:
     def __init__(self):
         self._ticker_cache: TTLCache[str, Dict[str, Any]] = TTLCache(max_items=2048)
         self._ohlcv_cache: TTLCache[Tuple[str, str, int], List[Any]] = TTLCache(max_items=1024)
-        
+        # yf.Ticker handles carry session/crumb state; reuse them per symbol
+        # instead of re-constructing (and re-authenticating) on every fetch.
+        self._yf_handles: TTLCache[str, Any] = TTLCache(max_items=512)
+
+    def _get_yf_ticker(self, sym: str):
+        handle = self._yf_handles.get(sym)
+        if handle is None:
+            handle = yf.Ticker(sym)
+            self._yf_handles.set(sym, handle, ttl_seconds=3600.0)
+        return handle
+
     def _normalize_symbol(self, symbol: str) -> str:
         """
         Stock symbols are straightforward (e.g. AAPL, MSFT).
@@ -67,12 +102,21 @@ class ExchangeProvider:
             "default_type": "spot",
         }
 
-    def fetch_ohlcv(self, symbol: str, timeframe: str = '1h', limit: int = 100) -> List[Any]:
+    @staticmethod
+    def _as_fmt(ohlcv: List[Any], fmt: str) -> Any:
+        # "numpy" gives numeric consumers an (N, 6) float64 array and skips
+        # their per-call DataFrame/list repacking; default stays list-of-lists.
+        if fmt == "numpy":
+            return np.asarray(ohlcv, dtype=np.float64)
+        return ohlcv
+
+    def fetch_ohlcv(self, symbol: str, timeframe: str = '1h', limit: int = 100, fmt: str = "list") -> Any:
         """
         Fetch OHLCV data using yfinance.
         Mapped to CCXT cache format: [[timestamp, open, high, low, close, volume], ...]
+        With fmt="numpy", returns the same candles as an (N, 6) float64 ndarray.
         """
-        ttl = float(os.getenv("OHLCV_CACHE_TTL_SEC", "60"))
+        ttl = _env_ttl("OHLCV_CACHE_TTL_SEC", 60.0)
         tf_sec = _parse_timeframe_seconds(timeframe)
         if tf_sec:
             ttl = min(ttl, float(_seconds_to_next_boundary(tf_sec) + 1))
@@ -81,44 +125,26 @@ class ExchangeProvider:
         cache_key = ("ohlcv", sym, timeframe, int(limit))
         cached = self._ohlcv_cache.get(cache_key)
         if cached is not None:
-            return cached
+            return self._as_fmt(cached, fmt)
 
         try:
-            # yfinance interval mapping
-            yf_interval = timeframe
-            if timeframe == "1h":
-                yf_interval = "1h"
-            elif timeframe == "1d":
-                yf_interval = "1d"
-            elif timeframe == "1m":
-                yf_interval = "1m"
-            
-            period = "1mo"
-            if timeframe == '1m':
-                period = "5d"
-            if timeframe == '1d':
-                period = "1y"
+            yf_interval, period = _YF_REQUEST_SHAPE.get(timeframe, (timeframe, "1mo"))
 
-            ticker = yf.Ticker(sym)
+            ticker = self._get_yf_ticker(sym)
             df = ticker.history(period=period, interval=yf_interval)
             
             if df.empty:
                 raise AppError("data_not_found", f"No OHLCV history found for {sym} via yfinance.", {"symbol": sym})
 
-            ohlcv = []
-            for index, row in df.tail(limit).iterrows():
-                ts = int(index.timestamp() * 1000)
-                ohlcv.append([
-                    ts,
-                    float(row['Open']),
-                    float(row['High']),
-                    float(row['Low']),
-                    float(row['Close']),
-                    float(row['Volume'])
-                ])
-                
+            # Convert columns in bulk (numpy) instead of per-row iterrows,
+            # which re-boxes every cell through pandas Series machinery.
+            tail = df.tail(limit)
+            ts_ms = (tail.index.asi8 // 1_000_000).tolist()
+            values = tail[['Open', 'High', 'Low', 'Close', 'Volume']].to_numpy(dtype=float).tolist()
+            ohlcv = [[ts, *row] for ts, row in zip(ts_ms, values)]
+
             self._ohlcv_cache.set(cache_key, ohlcv, ttl_seconds=ttl)
-            return ohlcv
+            return self._as_fmt(ohlcv, fmt)
             
         except AppError:
             raise
@@ -129,7 +155,7 @@ class ExchangeProvider:
         """
         Fetch ticker info (price).
         """
-        ttl = float(os.getenv("TICKER_CACHE_TTL_SEC", "5"))
+        ttl = _env_ttl("TICKER_CACHE_TTL_SEC", 5.0)
         sym = self._normalize_symbol(symbol)
         cache_key = ("ticker", sym)
         cached = self._ticker_cache.get(cache_key)
@@ -137,18 +163,40 @@ class ExchangeProvider:
             return cached
 
         try:
-            ticker = yf.Ticker(sym)
-            hist = ticker.history(period="5d")
-            
-            if hist.empty:
-                raise AppError("data_not_found", f"No price data found for {sym} via yfinance.", {"symbol": sym})
-
-            last_row = hist.iloc[-1]
-            price = float(last_row['Close'])
-            open_px = float(last_row['Open'])
-            high = float(last_row['High'])
-            low = float(last_row['Low'])
-            volume = float(last_row['Volume'])
+            ticker = self._get_yf_ticker(sym)
+
+            # Hot path: fast_info answers with a handful of scalars and skips
+            # the full history download + DataFrame construction.
+            def _num(container, key) -> Optional[float]:
+                try:
+                    v = container[key]
+                except Exception:
+                    return None
+                return float(v) if isinstance(v, (int, float)) else None
+
+            price = open_px = high = low = volume = None
+            try:
+                fi = ticker.fast_info
+                price = _num(fi, "last_price")
+                open_px = _num(fi, "open")
+                high = _num(fi, "day_high")
+                low = _num(fi, "day_low")
+                volume = _num(fi, "last_volume")
+            except Exception:
+                price = None
+
+            if price is None or price <= 0:
+                hist = ticker.history(period="5d")
+
+                if hist.empty:
+                    raise AppError("data_not_found", f"No price data found for {sym} via yfinance.", {"symbol": sym})
+
+                last_row = hist.iloc[-1]
+                price = float(last_row['Close'])
+                open_px = float(last_row['Open'])
+                high = float(last_row['High'])
+                low = float(last_row['Low'])
+                volume = float(last_row['Volume'])
             
             data = {
                 "symbol": sym,
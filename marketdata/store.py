@@ -7,7 +7,9 @@ from typing import Any, Dict, List, Optional, Tuple
 from common.cache import TTLCache
 
 
-@dataclass(frozen=True)
+# slots: one snapshot is allocated per ingested tick (websocket feeds push
+# these continuously), so skipping the per-instance __dict__ matters.
+@dataclass(frozen=True, slots=True)
 class TickerSnapshot:
     symbol: str
     last: float
@@ -26,6 +26,15 @@ import websockets
 
 from .store import InMemoryMarketDataStore
 
+# Optional fast JSON parse for the per-message feed hot path; stdlib json is
+# noticeably slower on the large numeric arrays streamed by Alpaca.
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 
 class _MetricsLike:
     """
@@ -183,7 +192,7 @@ class AlpacaTickerStream(_WsStream):
                     await ws.send(json.dumps(auth_msg))
                     
                     auth_resp = await asyncio.wait_for(ws.recv(), timeout=10)
-                    auth_data = json.loads(auth_resp)
+                    auth_data = _loads(auth_resp)
                     if auth_data[0].get("T") == "error":
                         self._last_error = f"Auth failed: {auth_data[0].get('msg')}"
                         await self._sleep_backoff(10)
@@ -200,7 +209,7 @@ class AlpacaTickerStream(_WsStream):
                     backoff = 1.0
                     while not self._stop.is_set():
                         raw = await asyncio.wait_for(ws.recv(), timeout=30)
-                        msg = json.loads(raw)
+                        msg = _loads(raw)
                         snaps = parse_alpaca_ticker_message(msg)
                         
                         if not snaps:
@@ -1,15 +1,40 @@
 from __future__ import annotations
 
+import atexit
 import csv
 import hashlib
 import io
 import json
 import os
+import queue
 import sqlite3
 import threading
 import time
 from typing import Any, Dict, Optional
 
+# Writer batching: drain up to this many rows per INSERT, or whatever arrived
+# within the wait window, so the per-event fsync cost is amortized.
+_BATCH_MAX_ROWS = 256
+_BATCH_WAIT_S = 0.05
+
+
+def _chain_hash(prev_hash: str, ts_ms: Any, request_id: str, tool: str, ok: int, payload: str) -> str:
+    """
+    Hash-chain digest for one audit row.
+
+    Feeds the fields into the hasher incrementally instead of building (and
+    then encoding) one large concatenated string; the resulting digest is
+    byte-identical to hashing f"{prev}|{ts}|{req}|{tool}|{ok}|{payload}".
+    """
+    h = hashlib.sha256()
+    h.update(prev_hash.encode())
+    for part in (ts_ms, request_id, tool, ok):
+        h.update(b"|")
+        h.update(str(part).encode())
+    h.update(b"|")
+    h.update(payload.encode())
+    return h.hexdigest()
+
 
 class AuditLog:
     """
@@ -30,6 +55,13 @@ class AuditLog:
     def __init__(self) -> None:
         self._lock = threading.Lock()
         self._conn: Optional[sqlite3.Connection] = None
+        # Tail of the hash chain; seeded from the DB on first append so
+        # subsequent appends skip the SELECT entirely.
+        self._last_hash: Optional[str] = None
+        # Rows are hashed/ordered in append() but written by a background
+        # thread in batches; readers call flush() for read-after-write.
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
 
     def enabled(self) -> bool:
         # Default enabled in 'data/audit.db' if directory exists
@@ -58,22 +90,24 @@ class AuditLog:
         payload = self._serialize_payload(summary)
         
         with self._lock:
-            # Fetch the hash of the last entry to chain them together
-            cursor = conn.execute("SELECT hash FROM audit_events ORDER BY id DESC LIMIT 1")
-            last_row = cursor.fetchone()
-            prev_hash = last_row[0] if last_row else "INITIAL_HASH"
-            
-            # Create a string to hash: combine previous hash with current entry data
-            data_to_hash = f"{prev_hash}|{ts_ms}|{request_id}|{tool}|{1 if ok else 0}|{payload}"
-            current_hash = hashlib.sha256(data_to_hash.encode()).hexdigest()
-            
-            conn.execute(
-                """
-                INSERT INTO audit_events(
-                    ts_ms, request_id, tool, ok, error_code, mode, venue, exchange, market_type, summary_json, hash, previous_hash
-                )
-                VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+            # Chain tail is kept in memory; only the first append after
+            # startup has to read it back from the DB.
+            prev_hash = self._last_hash
+            if prev_hash is None:
+                cursor = conn.execute("SELECT hash FROM audit_events ORDER BY id DESC LIMIT 1")
+                last_row = cursor.fetchone()
+                prev_hash = last_row[0] if last_row else "INITIAL_HASH"
+
+            # Chain the entry to its predecessor
+            current_hash = _chain_hash(prev_hash, ts_ms, request_id, tool, 1 if ok else 0, payload)
+            self._last_hash = current_hash
+            self._ensure_writer()
+
+            # Enqueue under the same lock that advanced the chain tail:
+            # concurrent appends must hit the queue in chain order, or the
+            # writer inserts rows whose previous_hash doesn't match the
+            # preceding row and verify_integrity() flags a legitimate log.
+            self._queue.put(
                 (
                     int(ts_ms),
                     str(request_id),
@@ -86,11 +120,72 @@ class AuditLog:
                     market_type,
                     payload,
                     current_hash,
-                    prev_hash
-                ),
+                    prev_hash,
+                )
+            )
+
+    def flush(self) -> None:
+        """
+        Block until all queued events are committed (shutdown / read-after-write).
+        """
+        self._queue.join()
+
+    def _ensure_writer(self) -> None:
+        # Caller must hold self._lock.
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._writer_loop, name="audit-writer", daemon=True)
+            self._writer.start()
+            # Drain whatever is still queued before the interpreter exits;
+            # the daemon writer alone would drop up to a batch of events.
+            atexit.register(self.flush)
+
+    def _insert_rows(self, conn: sqlite3.Connection, rows: list) -> None:
+        with self._lock:
+            conn.executemany(
+                """
+                INSERT INTO audit_events(
+                    ts_ms, request_id, tool, ok, error_code, mode, venue, exchange, market_type, summary_json, hash, previous_hash
+                )
+                VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
             )
             conn.commit()
 
+    def _writer_loop(self) -> None:
+        while True:
+            rows = [self._queue.get()]
+            deadline = time.time() + _BATCH_WAIT_S
+            while len(rows) < _BATCH_MAX_ROWS:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    rows.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                conn = self._get_conn()
+                if conn is not None:
+                    self._insert_rows(conn, rows)
+            except Exception:  # nosec - audit is best-effort; never kill the writer
+                # One retry covers transient failures (e.g. a briefly locked DB).
+                try:
+                    time.sleep(0.1)
+                    conn = self._get_conn()
+                    if conn is not None:
+                        self._insert_rows(conn, rows)
+                except Exception:
+                    # The batch is lost, so the in-memory chain tail now points
+                    # at hashes that never reached the DB. Drop the cached tail:
+                    # the next append re-seeds from the last written row and the
+                    # on-disk chain stays verifiable.
+                    with self._lock:
+                        self._last_hash = None
+            finally:
+                for _ in rows:
+                    self._queue.task_done()
+
     def verify_integrity(self) -> bool:
         """
         Verify the cryptographic integrity of the entire audit log.
@@ -98,7 +193,8 @@ class AuditLog:
         conn = self._get_conn()
         if conn is None:
             return True
-        
+
+        self.flush()
         with self._lock:
             cursor = conn.execute("SELECT ts_ms, request_id, tool, ok, summary_json, hash, previous_hash FROM audit_events ORDER BY id ASC")
             rows = cursor.fetchall()
@@ -110,8 +206,7 @@ class AuditLog:
                     return False
                 
                 # Recompute hash using same logic
-                data_to_hash = f"{prev_hash}|{ts_ms}|{req_id}|{tool}|{ok}|{summary}"
-                computed = hashlib.sha256(data_to_hash.encode()).hexdigest()
+                computed = _chain_hash(prev_hash, ts_ms, req_id, tool, ok, summary)
                 if computed != cur_hash:
                     return False
                 last_hash = cur_hash
@@ -129,7 +224,8 @@ class AuditLog:
         conn = self._get_conn()
         if conn is None:
             return "Timestamp,Type,Details,Status\n" # Empty CSV
-            
+
+        self.flush()
         with self._lock:
             # Query only successful execution tools
             cursor = conn.execute(
@@ -192,6 +288,9 @@ class AuditLog:
         return p
 
     def _get_conn(self) -> Optional[sqlite3.Connection]:
+        # Fast path: skip the env read + makedirs once connected.
+        if self._conn is not None:
+            return self._conn
         path = self._db_path()
         if not path:
             return None
@@ -5,6 +5,7 @@ import json
 import os
 import time
 import uuid
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 _CURRENT_CTX: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar(
@@ -17,21 +18,32 @@ def get_current_context() -> Optional[Dict[str, Any]]:
     return _CURRENT_CTX.get()
 
 
-def set_current_context(ctx: Optional[Dict[str, Any]]) -> None:
-    _CURRENT_CTX.set(ctx)
+def set_current_context(ctx: Optional[Dict[str, Any]]) -> contextvars.Token:
+    """
+    Install ctx for the current task/thread. Returns a token for
+    reset_current_context, so nested scopes restore the outer context instead
+    of clobbering it with None.
+    """
+    return _CURRENT_CTX.set(ctx)
+
+
+def reset_current_context(token: contextvars.Token) -> None:
+    _CURRENT_CTX.reset(token)
 
 
 _LEVELS = {"debug": 10, "info": 20, "warn": 30, "warning": 30, "error": 40}
 
 
+@lru_cache(maxsize=16)
 def _level_value(level: str) -> int:
+    # log_event runs this (plus the min-level parse below) on every call,
+    # including suppressed ones, so both are memoized on the raw strings.
     return _LEVELS.get(str(level or "").strip().lower(), 20)
 
 
 def _min_level_value() -> int:
     # Prefer explicit READYTRADER_LOG_LEVEL, fallback to LOG_LEVEL.
-    raw = (os.getenv("READYTRADER_LOG_LEVEL") or os.getenv("LOG_LEVEL") or "info").strip().lower()
-    return _level_value(raw)
+    return _level_value(os.getenv("READYTRADER_LOG_LEVEL") or os.getenv("LOG_LEVEL") or "info")
 
 
 _SENSITIVE_KEYWORDS = ("secret", "password", "token", "private", "mnemonic", "api_key", "apikey", "seed")
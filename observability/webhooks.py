@@ -1,8 +1,18 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Optional
 
 import requests
 
+# Dedicated delivery worker: callers (e.g. ExecutionStore.create, which holds
+# its lock) must not block on webhook HTTP round trips.
+_DELIVERY_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="webhook-delivery")
+
+# Shared session: back-to-back notifications (Discord + Telegram per approval)
+# reuse pooled connections instead of a fresh TLS handshake per delivery.
+_session = requests.Session()
+_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=4, pool_block=False))
+
 
 class WebhookManager:
     """
@@ -20,7 +30,7 @@ class WebhookManager:
             payload["embeds"] = [embed]
             
         try:
-            requests.post(webhook_url, json=payload, timeout=5)
+            _session.post(webhook_url, json=payload, timeout=5)
         except Exception: # nosec
             pass # Silent failure for observability
 
@@ -39,7 +49,7 @@ class WebhookManager:
         }
         
         try:
-            requests.post(url, json=payload, timeout=5)
+            _session.post(url, json=payload, timeout=5)
         except Exception: # nosec
             pass
 
@@ -63,5 +73,7 @@ class WebhookManager:
             "footer": {"text": "ReadyTrader-Stocks Guardian Mode"}
         }
         
-        cls.send_discord_notification(msg, embed=embed)
-        cls.send_telegram_notification(msg)
+        # Fire-and-forget: deliveries already fail silently, so queue them on
+        # the background worker instead of the request thread.
+        _DELIVERY_POOL.submit(cls.send_discord_notification, msg, embed)
+        _DELIVERY_POOL.submit(cls.send_telegram_notification, msg)
@@ -0,0 +1,49 @@
+"""
+Hot-loop SMA kernel for SmaStrategy.
+
+numba is an optional accelerator: when it is installed the kernel is
+JIT-compiled (and cached on disk), otherwise the plain-Python fallback
+decorator leaves a perfectly correct NumPy loop in place.
+"""
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):  # no-op fallback decorator
+        def wrap(fn):
+            return fn
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True)
+def dual_sma(close: np.ndarray, short_window: int, long_window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute two fixed-window simple moving averages in one running-sum pass.
+
+    Positions with fewer than `window` samples are NaN, matching the
+    pandas/pandas_ta rolling-mean convention.
+    """
+    n = close.shape[0]
+    short_out = np.full(n, np.nan)
+    long_out = np.full(n, np.nan)
+    short_sum = 0.0
+    long_sum = 0.0
+    for i in range(n):
+        short_sum += close[i]
+        long_sum += close[i]
+        if i >= short_window:
+            short_sum -= close[i - short_window]
+        if i >= long_window:
+            long_sum -= close[i - long_window]
+        if i >= short_window - 1:
+            short_out[i] = short_sum / short_window
+        if i >= long_window - 1:
+            long_out[i] = long_sum / long_window
+    return short_out, long_out
@@ -1,13 +1,24 @@
+import atexit
 import json
 import os
 import secrets
 import sqlite3
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
 
+try:
+    import zstandard
+    _ZSTD_AVAILABLE = True
+except ImportError:
+    _ZSTD_AVAILABLE = False
 
-@dataclass
+
+# slots: list_strategies materializes one of these per row; frozen: artifacts
+# are immutable records (use dataclasses.replace to derive variants).
+@dataclass(slots=True, frozen=True)
 class StrategyArtifact:
     strategy_id: str
     name: str
@@ -18,14 +29,83 @@ class StrategyArtifact:
     config_json: str
     created_at: int
 
+# Directories we've already ensured exist; skips the stat/mkdir syscall pair
+# when registries are re-instantiated against the same path.
+_MKDIR_CACHE: set = set()
+
+
+@lru_cache(maxsize=4)
+def _parse_bool(raw: str) -> bool:
+    return raw.strip().lower() == "true"
+
+
+def _compress_enabled() -> bool:
+    # Opt-in: large nested param grids compress well, but the TEXT path stays
+    # the default for backward compatibility (and when zstandard is absent).
+    return _ZSTD_AVAILABLE and _parse_bool(os.getenv("REALTRADER_COMPRESS_CONFIG") or "")
+
+# Explicit column list in StrategyArtifact field order, so SELECTs stay
+# correct regardless of table column order and remain index-friendly.
+_COLS = "strategy_id, name, author, backtest_pnl_pct, backtest_sharpe, logic_summary, config_json, created_at"
+
+# Hot statements built once; passing the same string objects keeps them
+# pinned in sqlite3's per-connection statement cache (no re-parse/re-plan).
+_SQL_INSERT = f"INSERT INTO strategies ({_COLS}, config_blob) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_SQL_LIST = f"SELECT {_COLS}, config_blob FROM strategies ORDER BY backtest_pnl_pct DESC LIMIT ?"
+_SQL_GET = f"SELECT {_COLS}, config_blob FROM strategies WHERE strategy_id = ?"
+
+
+def _artifact_from_row(row: tuple) -> StrategyArtifact:
+    """Build an artifact from a `{_COLS}, config_blob` row, inflating
+    zstd-compressed configs back into config_json."""
+    config_json, blob = row[6], row[8]
+    if blob is not None and not config_json and _ZSTD_AVAILABLE:
+        config_json = zstandard.ZstdDecompressor().decompress(blob).decode()
+    return StrategyArtifact(row[0], row[1], row[2], row[3], row[4], row[5], config_json, row[7])
+
+
 class StrategyRegistry:
     """
     Local marketplace for saving and sharing agent strategies.
     """
     def __init__(self, db_path: Optional[str] = None):
         self.db_path = db_path or os.getenv("REALTRADER_STRATEGY_DB_PATH", os.getenv("STRATEGY_DB_PATH", "data/strategies.db"))
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        d = os.path.dirname(self.db_path)
+        if d and d not in _MKDIR_CACHE:
+            os.makedirs(d, exist_ok=True)
+            _MKDIR_CACHE.add(d)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
         self._init_db()
+        atexit.register(self.close)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Fast path: reuse the cached connection instead of paying the
+        # per-call open (page-cache warm-up, journal setup) on every method.
+        if self._conn is not None:
+            return self._conn
+        with self._lock:
+            if self._conn is None:
+                conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+                conn.execute("PRAGMA journal_mode=WAL;")
+                conn.execute("PRAGMA synchronous=NORMAL;")
+                conn.execute("PRAGMA temp_store=MEMORY;")
+                # Read-heavy list queries: mmap the database (256MiB window)
+                # so index scans skip read() syscalls, with ~20MiB page cache.
+                conn.execute("PRAGMA mmap_size=268435456;")
+                conn.execute("PRAGMA cache_size=-20000;")
+                self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.execute("PRAGMA optimize")
+                    self._conn.close()
+                except Exception:
+                    pass
+                self._conn = None
 
     def _init_db(self):
         with sqlite3.connect(self.db_path) as conn:
@@ -42,49 +122,75 @@ class StrategyRegistry:
                 )
             """)
             conn.execute("CREATE INDEX IF NOT EXISTS idx_strategy_name ON strategies(name)")
+            # list_strategies orders by PnL with a LIMIT; this index turns the
+            # full-table scan + sort into a short index walk.
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_strategies_pnl_desc ON strategies(backtest_pnl_pct DESC)")
+            # Migrate pre-existing databases to carry the compressed-config column
+            cols = [r[1] for r in conn.execute("PRAGMA table_info(strategies)").fetchall()]
+            if "config_blob" not in cols:
+                conn.execute("ALTER TABLE strategies ADD COLUMN config_blob BLOB")
 
     def register_strategy(self, name: str, author: str, pnl: float, sharpe: float, summary: str, config: Dict[str, Any]) -> StrategyArtifact:
-        strategy_id = secrets.token_hex(6)
         artifact = StrategyArtifact(
-            strategy_id=strategy_id,
+            strategy_id=secrets.token_hex(6),
             name=name,
             author=author,
             backtest_pnl_pct=float(pnl),
             backtest_sharpe=float(sharpe),
             logic_summary=summary,
-            config_json=json.dumps(config),
-            created_at=int(time.time())
+            # Compact separators: the blob is stored and re-read, not shown.
+            config_json=json.dumps(config, separators=(',', ':')),
+            created_at=time.time_ns() // 10**9,
         )
-        
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO strategies (strategy_id, name, author, backtest_pnl_pct, backtest_sharpe, logic_summary, config_json, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                artifact.strategy_id,
-                artifact.name,
-                artifact.author,
-                artifact.backtest_pnl_pct,
-                artifact.backtest_sharpe,
-                artifact.logic_summary,
-                artifact.config_json,
-                artifact.created_at
-            ))
+        self.register_strategies_bulk([artifact])
         return artifact
 
+    def register_strategies_bulk(self, artifacts: List[StrategyArtifact]) -> None:
+        """
+        Insert many artifacts in one transaction (e.g. from a backtest sweep),
+        amortizing the per-commit fsync over the whole batch.
+        """
+        if not artifacts:
+            return
+        compressor = zstandard.ZstdCompressor(level=3) if _compress_enabled() else None
+        rows = []
+        for a in artifacts:
+            if compressor is not None:
+                config_json, blob = "", compressor.compress(a.config_json.encode())
+            else:
+                config_json, blob = a.config_json, None
+            rows.append(
+                (a.strategy_id, a.name, a.author, a.backtest_pnl_pct, a.backtest_sharpe,
+                 a.logic_summary, config_json, a.created_at, blob)
+            )
+        conn = self._connect()
+        with self._lock, conn:
+            conn.executemany(_SQL_INSERT, rows)
+
+    def iter_strategies(self, limit: int = 10) -> Iterator[StrategyArtifact]:
+        """
+        Stream artifacts in PnL order in fetchmany batches, so large limits
+        don't materialize the whole result set at once. The lock is only held
+        per batch, not across consumer iterations.
+        """
+        conn = self._connect()
+        with self._lock:
+            cursor = conn.execute(_SQL_LIST, (limit,))
+        while True:
+            with self._lock:
+                batch = cursor.fetchmany(256)
+            if not batch:
+                return
+            for row in batch:
+                yield _artifact_from_row(row)
+
     def list_strategies(self, limit: int = 10) -> List[StrategyArtifact]:
-        query = "SELECT * FROM strategies ORDER BY backtest_pnl_pct DESC LIMIT ?"
-        results = []
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(query, (limit,))
-            for row in cursor:
-                results.append(StrategyArtifact(*row))
-        return results
+        return list(self.iter_strategies(limit))
 
     def get_strategy(self, strategy_id: str) -> Optional[StrategyArtifact]:
-        query = "SELECT * FROM strategies WHERE strategy_id = ?"
-        with sqlite3.connect(self.db_path) as conn:
-            row = conn.execute(query, (strategy_id,)).fetchone()
-            if row:
-                return StrategyArtifact(*row)
+        conn = self._connect()
+        with self._lock:
+            row = conn.execute(_SQL_GET, (strategy_id,)).fetchone()
+        if row:
+            return _artifact_from_row(row)
         return None
@@ -1,13 +1,21 @@
 
 import logging
+from functools import lru_cache
 from typing import Any, Dict
 
-import pandas as pd
+import numpy as np
 
 from app.core.container import global_container
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=256)
+def _warn_insufficient_data(symbol: str) -> None:
+    # Scheduler loops poll analyze() tightly; warn once per symbol per
+    # process instead of on every poll.
+    logger.warning(f"Not enough data for {symbol}")
+
 class SmaStrategy:
     """
     Simple Moving Average (SMA) Crossover Strategy for Stocks.
@@ -16,7 +24,15 @@ class SmaStrategy:
         self.symbol = symbol
         self.short_window = short_window
         self.long_window = long_window
-        
+        # The provider is a process-lifetime singleton; bind it once instead
+        # of chasing the container attribute on every analyze() poll.
+        self._provider = global_container.exchange_provider
+        # Memoized last signal, keyed on the newest bar's timestamp: daily
+        # bars change rarely while schedulers poll often.
+        self._last_bar_ts: float = -1.0
+        self._last_result: Dict[str, Any] | None = None
+
+
     def analyze(self) -> Dict[str, Any]:
         """
         Fetch data, calculate indicators, and return signal.
@@ -24,57 +40,56 @@ class SmaStrategy:
         """
         # Fetch OHLCV using the container's exchange provider (yfinance)
         # We need enough data for the long window
-        limit = self.long_window + 10 
-        provider = global_container.exchange_provider
-        
+        limit = self.long_window + 10
+        provider = self._provider
+
         try:
-            ohlcv = provider.fetch_ohlcv(self.symbol, timeframe="1d", limit=limit)
-            if not ohlcv or len(ohlcv) < self.long_window:
-                logger.warning(f"Not enough data for {self.symbol}")
+            ohlcv = provider.fetch_ohlcv(self.symbol, timeframe="1d", limit=limit, fmt="numpy")
+            if ohlcv is None or len(ohlcv) < self.long_window:
+                _warn_insufficient_data(self.symbol)
                 return {"signal": 0, "reason": "insufficient_data"}
             
-            # Convert to DataFrame
-            df = pd.DataFrame(ohlcv, columns=["timestamp", "open", "high", "low", "close", "volume"])
-            df['close'] = df['close'].astype(float)
-            
-            # Calculate SMAs using pandas_ta
-            df.ta.sma(length=self.short_window, append=True)
-            df.ta.sma(length=self.long_window, append=True)
-            
-            # Get last two rows to check for crossover
-            curr = df.iloc[-1]
-            prev = df.iloc[-2]
-            
-            short_col = f"SMA_{self.short_window}"
-            long_col = f"SMA_{self.long_window}"
-            
-            # Check for Golden Cross (Short crosses above Long)
-            if prev[short_col] <= prev[long_col] and curr[short_col] > curr[long_col]:
-                return {
-                    "signal": 1,
-                    "reason": "golden_cross",
-                    "short_val": curr[short_col],
-                    "long_val": curr[long_col],
-                    "price": curr['close']
-                }
-            
-            # Check for Death Cross (Short crosses below Long)
-            elif prev[short_col] >= prev[long_col] and curr[short_col] < curr[long_col]:
-                return {
-                    "signal": -1,
-                    "reason": "death_cross",
-                    "short_val": curr[short_col],
-                    "long_val": curr[long_col],
-                    "price": curr['close']
-                }
-                
-            return {
-                "signal": 0,
-                "reason": "no_crossover",
-                "short_val": curr[short_col],
-                "long_val": curr[long_col],
-                "price": curr['close']
+            # Same bar as last time -> same signal; skip the SMA recompute.
+            last_ts = float(ohlcv[-1][0])
+            if self._last_result is not None and last_ts == self._last_bar_ts:
+                return self._last_result
+
+            # Only the close column feeds the signal. asarray is a no-copy
+            # pass-through when the provider already returned fmt="numpy";
+            # mocked/plugin providers that hand back lists still work.
+            close = np.asarray(ohlcv, dtype=np.float64)[:, 4]
+
+            # Both SMAs in a single running-sum pass. Imported lazily so the
+            # kernel module (and numba's slow import, when installed) is only
+            # paid by processes that actually run the strategy; after the
+            # first call this is a sys.modules lookup.
+            from strategy._sma_jit import dual_sma
+            short_arr, long_arr = dual_sma(close, self.short_window, self.long_window)
+
+            # Last two points are enough to check for a crossover; take them
+            # as Python floats so the result dict serializes cleanly.
+            curr_short, curr_long = float(short_arr[-1]), float(long_arr[-1])
+            prev_short, prev_long = float(short_arr[-2]), float(long_arr[-2])
+            price = float(close[-1])
+
+            # Golden Cross (short crosses above long) / Death Cross (below)
+            if prev_short <= prev_long and curr_short > curr_long:
+                signal, reason = 1, "golden_cross"
+            elif prev_short >= prev_long and curr_short < curr_long:
+                signal, reason = -1, "death_cross"
+            else:
+                signal, reason = 0, "no_crossover"
+
+            result = {
+                "signal": signal,
+                "reason": reason,
+                "short_val": curr_short,
+                "long_val": curr_long,
+                "price": price
             }
+            self._last_bar_ts = last_ts
+            self._last_result = result
+            return result
             
         except Exception as e:
             logger.error(f"Strategy error: {e}")
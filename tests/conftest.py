@@ -17,27 +17,35 @@ def mock_env_setup():
     # Ensures these are set for every test
     pass
 
-@pytest.fixture
+# The container holds process-lifetime singletons, so the fixtures resolve
+# them once per session instead of re-running fixture setup for every test.
+
+@pytest.fixture(scope="session")
 def container():
     from app.core.container import global_container
     return global_container
 
 @pytest.fixture
 def backtest_engine(container):
-    return container.backtest_engine
-
-@pytest.fixture
+    # Some tests monkey-patch fetch_ohlcv on the shared engine; stay
+    # function-scoped and restore it so the patch can't leak across tests.
+    engine = container.backtest_engine
+    original_fetch = engine.fetch_ohlcv
+    yield engine
+    engine.fetch_ohlcv = original_fetch
+
+@pytest.fixture(scope="session")
 def paper_engine(container):
     return container.paper_engine
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def policy_engine(container):
     return container.policy_engine
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def risk_guardian(container):
     return container.risk_guardian
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def marketdata_bus(container):
     return container.marketdata_bus
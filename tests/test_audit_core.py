@@ -51,6 +51,31 @@ def test_audit_disabled_if_no_path():
                  assert not log.enabled()
                  log.append(ts_ms=1, request_id="r", tool="t", ok=True) # Should just return
 
+def test_audit_concurrent_appends_keep_chain_order(audit_db):
+    import threading
+
+    # Appends race from several threads; the chain tail and the enqueue are
+    # advanced under one lock, so the background writer must land every row
+    # in chain order and the hash chain must still verify.
+    def worker(n):
+        for i in range(25):
+            audit_db.append(ts_ms=n * 1000 + i, request_id=f"r{n}-{i}", tool="t", ok=True, summary={"i": i})
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    audit_db.flush()
+    assert audit_db.verify_integrity()
+
+    conn = sqlite3.connect(audit_db._db_path())
+    (count,) = conn.execute("SELECT COUNT(*) FROM audit_events").fetchone()
+    conn.close()
+    assert count == 100
+
+
 def test_initial_migration(tmp_path):
     # Test that migration adds columns if missing
     db_path = str(tmp_path / "old_audit.db")
@@ -66,3 +66,47 @@ def test_no_db_path():
          assert s.get("k") == {"a": 1} # in mem
          s.clear()
          assert s.get("k") is None # no persistence
+
+
+def test_idempotency_lru_eviction_bounds_memory():
+    import common.idempotency as idem
+
+    with patch.object(IdempotencyStore, "_db_path", return_value=""):
+        s = IdempotencyStore()
+        with patch("common.idempotency._SHARD_MAX_ITEMS", 2):
+            for i in range(100):
+                s.set(f"k{i}", {"i": i})
+            # Every shard is capped, so the cache cannot grow past shards * cap
+            assert sum(len(shard) for shard in s._shards) <= idem._SHARDS * 2
+        # The most recently inserted key is still resident
+        assert s.get("k99") == {"i": 99}
+
+
+def test_idempotency_lru_recent_use_survives_eviction():
+    import common.idempotency as idem
+
+    # Pick three keys that land in the same shard so eviction order is
+    # deterministic within it.
+    keys = []
+    target = None
+    i = 0
+    while len(keys) < 3:
+        k = f"key{i}"
+        shard = hash(k) % idem._SHARDS
+        if target is None:
+            target = shard
+            keys.append(k)
+        elif shard == target:
+            keys.append(k)
+        i += 1
+
+    with patch.object(IdempotencyStore, "_db_path", return_value=""):
+        s = IdempotencyStore()
+        with patch("common.idempotency._SHARD_MAX_ITEMS", 2):
+            s.set(keys[0], {"v": 0})
+            s.set(keys[1], {"v": 1})
+            assert s.get(keys[0]) == {"v": 0}  # touch: keys[0] becomes most recent
+            s.set(keys[2], {"v": 2})           # shard full: evicts keys[1]
+        assert s.get(keys[0]) == {"v": 0}
+        assert s.get(keys[1]) is None
+        assert s.get(keys[2]) == {"v": 2}
@@ -1,6 +1,10 @@
 
+from unittest.mock import patch
+
+import pytest
+
 from app.core.container import global_container
-from common.rate_limiter import FixedWindowRateLimiter
+from common.rate_limiter import FixedWindowRateLimiter, RateLimitError, TokenBucketRateLimiter
 
 
 def test_rate_limiting_blocks_after_limit():
@@ -18,3 +22,40 @@ def test_rate_limiting_blocks_after_limit():
         assert False, "Should have raised RateLimitError"
     except Exception:
         pass
+
+
+def test_token_bucket_allows_burst_then_blocks():
+    limiter = TokenBucketRateLimiter()
+    for _ in range(3):
+        limiter.check(key="k", limit=3, window_seconds=60)
+
+    with pytest.raises(RateLimitError) as exc_info:
+        limiter.check(key="k", limit=3, window_seconds=60)
+    assert exc_info.value.code == "rate_limited"
+    assert exc_info.value.data["retry_after_seconds"] > 0
+
+
+def test_token_bucket_refills_over_time():
+    limiter = TokenBucketRateLimiter()
+    # limit=2 over 2s -> refill rate of 1 token/second
+    with patch("common.rate_limiter.time.monotonic") as mono:
+        mono.return_value = 0.0
+        limiter.check(key="k", limit=2, window_seconds=2)
+        limiter.check(key="k", limit=2, window_seconds=2)
+        with pytest.raises(RateLimitError):
+            limiter.check(key="k", limit=2, window_seconds=2)
+
+        # A bit over one second later, one token has refilled
+        mono.return_value = 1.1
+        limiter.check(key="k", limit=2, window_seconds=2)
+        with pytest.raises(RateLimitError):
+            limiter.check(key="k", limit=2, window_seconds=2)
+
+
+def test_token_bucket_keys_are_independent():
+    limiter = TokenBucketRateLimiter()
+    limiter.check(key="a", limit=1, window_seconds=60)
+    # Exhausting "a" must not touch "b"'s bucket
+    limiter.check(key="b", limit=1, window_seconds=60)
+    with pytest.raises(RateLimitError):
+        limiter.check(key="a", limit=1, window_seconds=60)
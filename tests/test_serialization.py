@@ -0,0 +1,50 @@
+import json
+import os
+from unittest.mock import patch
+
+import common.serialization as ser
+from common.serialization import dumps_pretty, raw_fragment
+
+
+def test_dumps_pretty_sorted_and_parseable():
+    out = dumps_pretty({"b": 1, "a": {"d": 2, "c": [1, 2]}})
+    assert json.loads(out) == {"b": 1, "a": {"d": 2, "c": [1, 2]}}
+    # Keys are sorted regardless of encoder
+    assert out.index('"a"') < out.index('"b"')
+    # Pretty (indented) by default
+    assert "\n" in out
+
+
+def test_dumps_pretty_compact_mode():
+    ser._parse_pretty.cache_clear()
+    try:
+        with patch.dict(os.environ, {"JSON_PRETTY": "0"}):
+            out = dumps_pretty({"b": 1, "a": 2})
+    finally:
+        ser._parse_pretty.cache_clear()
+    assert "\n" not in out
+    assert json.loads(out) == {"a": 2, "b": 1}
+
+
+def test_dumps_pretty_stdlib_fallback_shape():
+    with patch.object(ser, "_ORJSON_AVAILABLE", False):
+        out = dumps_pretty({"b": 1, "a": 2})
+    assert out == json.dumps({"b": 1, "a": 2}, indent=2, sort_keys=True)
+
+
+def test_dumps_pretty_falls_back_for_non_str_keys():
+    # orjson rejects non-string keys (TypeError); the stdlib fallback
+    # stringifies them, so the envelope still encodes either way.
+    out = dumps_pretty({"k": {1: "a"}})
+    assert json.loads(out) == {"k": {"1": "a"}}
+
+
+def test_raw_fragment_contract():
+    frag = raw_fragment('{"x": 1}')
+    if frag is None:
+        # No splice support in this environment; callers must pass plain
+        # objects instead (the documented fallback path).
+        assert not ser._ORJSON_AVAILABLE or not hasattr(ser.orjson, "Fragment")
+    else:
+        out = dumps_pretty({"h": frag})
+        assert json.loads(out) == {"h": {"x": 1}}
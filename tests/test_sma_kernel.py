@@ -0,0 +1,34 @@
+import numpy as np
+
+from strategy._sma_jit import dual_sma
+
+
+def test_dual_sma_matches_rolling_mean():
+    rng = np.random.default_rng(42)
+    close = rng.uniform(50.0, 150.0, size=200)
+
+    short_arr, long_arr = dual_sma(close, 5, 20)
+
+    for window, arr in ((5, short_arr), (20, long_arr)):
+        for i in range(len(close)):
+            if i < window - 1:
+                assert np.isnan(arr[i])
+            else:
+                expected = close[i - window + 1 : i + 1].mean()
+                assert abs(arr[i] - expected) < 1e-9
+
+
+def test_dual_sma_constant_series():
+    close = np.full(50, 42.0)
+    short_arr, long_arr = dual_sma(close, 3, 10)
+    assert np.allclose(short_arr[2:], 42.0)
+    assert np.allclose(long_arr[9:], 42.0)
+
+
+def test_dual_sma_warmup_lengths():
+    close = np.arange(30, dtype=np.float64)
+    short_arr, long_arr = dual_sma(close, 4, 12)
+    assert len(short_arr) == len(close)
+    assert len(long_arr) == len(close)
+    assert np.isnan(short_arr[:3]).all() and not np.isnan(short_arr[3:]).any()
+    assert np.isnan(long_arr[:11]).all() and not np.isnan(long_arr[11:]).any()
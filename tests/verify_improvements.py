@@ -5,21 +5,30 @@ from intelligence.core import get_market_sentiment
 
 
 async def verify_improvements():
+    # Sentiment (blocking HTTP, pushed to a thread) and the ticker fetch are
+    # independent; run them concurrently so the verification takes as long as
+    # the slower of the two. return_exceptions keeps one failure from masking
+    # the other result.
+    sentiment, ticker = await asyncio.gather(
+        asyncio.to_thread(get_market_sentiment),
+        global_container.marketdata_bus.fetch_ticker("AAPL"),
+        return_exceptions=True,
+    )
+
     print("--- Verifying Sentiment ---")
-    sentiment = get_market_sentiment()
+    if isinstance(sentiment, BaseException):
+        raise sentiment
     print(f"Sentiment Output: {sentiment}")
     assert "CNN Fear & Greed" in sentiment or "Error fetching" in sentiment
-    
+
     print("\n--- Verifying Async Market Data ---")
-    # Fetch price for AAPL using async bus
-    try:
-        res = await global_container.marketdata_bus.fetch_ticker("AAPL")
-        print(f"Price for AAPL: {res.data.get('last')} (Source: {res.source})")
-        assert res.data.get('last') > 0
-    except Exception as e:
-        print(f"Market Data Fetch failed: {e}")
+    if isinstance(ticker, BaseException):
+        print(f"Market Data Fetch failed: {ticker}")
         # If it fails due to no provider keys, that's expected in some CI environments,
         # but locally it should work with mock fallback in StockMarketDataProvider if configured.
+    else:
+        print(f"Price for AAPL: {ticker.data.get('last')} (Source: {ticker.source})")
+        assert ticker.data.get('last') > 0
 
 if __name__ == "__main__":
     asyncio.run(verify_improvements())
@@ -1,12 +1,12 @@
 #!/usr/bin/env python3
+import importlib.util
 import os
 import shutil
 import subprocess  # nosec
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
-import requests
-
 # Color codes
 GREEN = "\033[92m"
 YELLOW = "\033[93m"
@@ -38,31 +38,61 @@ def check_dependencies() -> List[str]:
     # Key dependencies to check
     deps = ["fastmcp", "ccxt", "web3", "feedparser", "requests"]
     for dep in deps:
-        try:
-            __import__(dep)
+        # find_spec only checks that the package is installed, without
+        # executing its module init (web3/ccxt alone cost hundreds of ms).
+        if importlib.util.find_spec(dep) is not None:
             print(f"  {GREEN}[✓]{RESET} {dep}")
-        except ImportError:
+        else:
             print(f"  {RED}[✗]{RESET} {dep} (Missing)")
             missing.append(dep)
     return missing
 
 def check_connectivity():
     print("\nChecking Network Connectivity...")
+    # Imported here (like dotenv in check_keys) so the banner/deps-only paths
+    # don't pay for requests' transitive urllib3/certifi imports — and so a
+    # missing requests, just reported by check_dependencies, doesn't crash us.
+    try:
+        import requests
+    except ImportError:
+        print(f"  {YELLOW}[!]{RESET} requests not installed; skipping connectivity checks.")
+        return
+
     targets = [
         ("Binance API", "https://api.binance.com/api/v3/ping"),
         ("CoinDesk RSS", "https://www.coindesk.com/arc/outboundfeeds/rss/"),
         ("Fear & Greed Index", "https://api.alternative.me/fng/")
     ]
-    
-    for name, url in targets:
+
+    # A shared session reuses pooled connections instead of paying a fresh
+    # TCP+TLS handshake per probe; HEAD keeps the responses tiny, falling
+    # back to GET only where the endpoint rejects it.
+    sess = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=len(targets), pool_maxsize=len(targets))
+    sess.mount("https://", adapter)
+    sess.mount("http://", adapter)
+
+    def probe(target) -> str:
+        name, url = target
         try:
-            res = requests.get(url, timeout=5)
+            res = sess.head(url, timeout=5, allow_redirects=True)
+            if res.status_code == 405:
+                res = sess.get(url, timeout=5)
             if res.status_code == 200:
-                print(f"  {GREEN}[✓]{RESET} {name} reachable.")
-            else:
-                print(f"  {YELLOW}[?]{RESET} {name} returned status {res.status_code}.")
+                return f"  {GREEN}[✓]{RESET} {name} reachable."
+            return f"  {YELLOW}[?]{RESET} {name} returned status {res.status_code}."
         except Exception as e:
-            print(f"  {RED}[✗]{RESET} {name} unreachable: {str(e)}")
+            return f"  {RED}[✗]{RESET} {name} unreachable: {str(e)}"
+
+    # The probes are independent network I/O; run them concurrently so the
+    # step takes as long as the slowest endpoint, not the sum of all three.
+    # executor.map preserves target order for the printed results.
+    try:
+        with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+            for line in pool.map(probe, targets):
+                print(line)
+    finally:
+        sess.close()
 
 def check_keys():
     print("\nChecking Critical Keys in .env...")